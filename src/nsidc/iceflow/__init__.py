@@ -9,7 +9,7 @@ Users interact with `iceflow` by:
 * Downloading data (`download_iceflow_results`)
 * (Optional) Creating a parquet datastore to facilitate reading the data (`make_iceflow_parquet`)
 * Reading and doing analysis with the data (`dask.dataframe.read_parquet`,
-  `read_iceflow_datafiles`)
+  `read_iceflow_datafiles`, `read_iceflow_datafiles_lazy`)
 * (Optional, if using `read_iceflow_datafiles`) Transform the lat/lon/elev data
   into a target International Terrestrial Reference Frame (ITRF) (`transform_itrf`)
 
@@ -17,6 +17,12 @@ Users interact with `iceflow` by:
 
 from __future__ import annotations
 
+# TODO: add bumpversion config to control this version number, and the conda
+# recipe/meta.yaml.
+# Note: this is defined before the imports below, so that it can be used by
+# submodules (e.g., to key cached data by version).
+__version__ = "v0.3.0"
+
 from nsidc.iceflow.api import make_iceflow_parquet
 from nsidc.iceflow.data.fetch import download_iceflow_results, find_iceflow_data
 from nsidc.iceflow.data.models import (
@@ -29,20 +35,19 @@ from nsidc.iceflow.data.models import (
     ILATM1BDataset,
     ILVIS2Dataset,
 )
-from nsidc.iceflow.data.read import read_iceflow_datafiles
+from nsidc.iceflow.data.read import (
+    read_iceflow_datafiles,
+    read_iceflow_datafiles_lazy,
+)
 from nsidc.iceflow.itrf.converter import transform_itrf
 
-# TODO: add bumpversion config to control this version number, and the conda
-# recipe/meta.yaml.
-__version__ = "v0.3.0"
-
-
 __all__ = [
     "__version__",
     "make_iceflow_parquet",
     "download_iceflow_results",
     "find_iceflow_data",
     "read_iceflow_datafiles",
+    "read_iceflow_datafiles_lazy",
     "transform_itrf",
     "DatasetSearchParameters",
     "BoundingBox",
@@ -2,10 +2,17 @@
 
 from __future__ import annotations
 
+import functools
+import os
 import shutil
+from concurrent.futures import Executor
 from pathlib import Path
+from typing import cast
 
 import dask.dataframe as dd
+import numpy as np
+import pandas as pd
+from dask.delayed import delayed
 from loguru import logger
 
 from nsidc.iceflow.data.fetch import download_iceflow_results, find_iceflow_data
@@ -14,21 +21,77 @@ from nsidc.iceflow.data.models import (
     DatasetSearchParameters,
     IceflowDataFrame,
 )
-from nsidc.iceflow.data.read import read_iceflow_datafiles
+from nsidc.iceflow.data.read import (
+    _map_iceflow_datafiles,
+    read_iceflow_datafile,
+    read_iceflow_datafiles,
+)
 from nsidc.iceflow.itrf.converter import transform_itrf
 
 
+def _read_and_transform_datafile(
+    filepath: Path,
+    *,
+    target_itrf: str,
+    target_epoch: str | None = None,
+) -> IceflowDataFrame:
+    return transform_itrf(
+        data=read_iceflow_datafile(filepath),  # type: ignore[arg-type]
+        target_itrf=target_itrf,
+        target_epoch=target_epoch,
+    )
+
+
+# Columns written to the parquet datastore by `make_iceflow_parquet`.
+_PARQUET_COLUMNS = ["latitude", "longitude", "elevation", "dataset"]
+
+
+def _read_parquet_partition(
+    filepath: Path,
+    *,
+    target_itrf: str,
+    target_epoch: str | None,
+    store_float32: bool = False,
+) -> pd.DataFrame:
+    """Read the given data file into a partition of the parquet datastore."""
+    iceflow_df = _read_and_transform_datafile(
+        filepath,
+        target_itrf=target_itrf,
+        target_epoch=target_epoch,
+    )
+
+    if store_float32:
+        # The data are transformed in float64 and only downcast for storage.
+        iceflow_df = iceflow_df.astype(
+            {"latitude": np.float32, "longitude": np.float32, "elevation": np.float32}
+        )
+
+    # Add a (categorical) col w/ dataset name and version.
+    short_name, version = filepath.parent.name.split("_")
+    iceflow_df["dataset"] = pd.Categorical.from_codes(
+        np.zeros(len(iceflow_df), dtype=np.int8),
+        categories=pd.Index([f"{short_name}v{version}"]),
+    )
+
+    return cast(pd.DataFrame, iceflow_df[_PARQUET_COLUMNS])
+
+
 def fetch_iceflow_df(
     *,
     dataset_search_params: DatasetSearchParameters,
     output_dir: Path,
     # TODO: also add option for target epoch!!
     output_itrf: str | None = None,
+    executor: Executor | None = None,
 ) -> IceflowDataFrame:
     """Search for data matching parameters and return an IceflowDataframe.
 
     Optionally transform data to the given ITRF for consistency.
 
+    The downloaded files are read (and transformed) one at a time, unless a
+    `concurrent.futures` executor is given as `executor` to read them in
+    parallel (see `read_iceflow_datafiles`).
+
     Note: a potentially large amount of data may be returned, especially if the
     user requests a large spatial/temporal area across multiple datasets. The
     result may not even fit in memory!
@@ -46,13 +109,16 @@ def fetch_iceflow_df(
         output_dir=output_dir,
     )
 
-    iceflow_df = read_iceflow_datafiles(downloaded_files)
+    if output_itrf is None:
+        return read_iceflow_datafiles(downloaded_files, executor=executor)
 
-    if output_itrf is not None:
-        iceflow_df = transform_itrf(
-            data=iceflow_df,
-            target_itrf=output_itrf,
-        )
+    # Transform the data from each file as it is read, so that the
+    # untransformed data for all of the files is never held in memory at once.
+    iceflow_df = _map_iceflow_datafiles(
+        functools.partial(_read_and_transform_datafile, target_itrf=output_itrf),
+        downloaded_files,
+        executor=executor,
+    )
 
     return iceflow_df
 
@@ -63,6 +129,7 @@ def make_iceflow_parquet(
     target_itrf: str,
     overwrite: bool = False,
     target_epoch: str | None = None,
+    store_float32: bool = False,
 ) -> Path:
     """Create a parquet dataset containing the lat/lon/elev data in `data_dir`.
 
@@ -78,6 +145,11 @@ def make_iceflow_parquet(
     create a new `iceflow.parquet` for a different area or timespan, they will
     need to move/remove the existing `iceflow.parquet` first (e.g., with the
     `overwrite=True` kwarg).
+
+    Use `store_float32=True` to store the lat/lon/elev data as float32 rather
+    than float64. This halves the size of the datastore, at the cost of
+    precision: float32 latitudes and longitudes are only precise to around a
+    meter.
     """
     parquet_subdir = data_dir / "iceflow.parquet"
     if parquet_subdir.exists():
@@ -94,32 +166,45 @@ def make_iceflow_parquet(
         for ds in ALL_DATASETS
         if (data_dir / ds.subdir_name).is_dir()
     ]
-    for subdir in all_subdirs:
-        iceflow_filepaths = [path for path in subdir.iterdir() if path.is_file()]
-        iceflow_df = read_iceflow_datafiles(iceflow_filepaths)
-
-        iceflow_df = transform_itrf(
-            data=iceflow_df,
+    # `os.scandir` entries cache the file type from the directory listing, so
+    # this does not need to `stat` each file (unlike `Path.is_file`).
+    iceflow_filepaths = [
+        Path(entry.path)
+        for subdir in all_subdirs
+        for entry in os.scandir(subdir)
+        if entry.is_file()
+    ]
+    if not iceflow_filepaths:
+        return parquet_subdir
+
+    # Each data file is read and transformed as a separate partition, so that
+    # dask can process the files in parallel and write the datastore in a
+    # single pass.
+    partitions = [
+        delayed(_read_parquet_partition)(
+            filepath,
             target_itrf=target_itrf,
             target_epoch=target_epoch,
+            store_float32=store_float32,
         )
-
-        # Add a string col w/ dataset name and version.
-        short_name, version = subdir.name.split("_")
-        iceflow_df["dataset"] = [f"{short_name}v{version}"] * len(iceflow_df.latitude)
-        common_columns = ["latitude", "longitude", "elevation", "dataset"]
-        common_dask_df = dd.from_pandas(iceflow_df[common_columns])  # type: ignore[attr-defined]
-        if parquet_subdir.exists():
-            dd.to_parquet(  # type: ignore[attr-defined]
-                df=common_dask_df,
-                path=parquet_subdir,
-                append=True,
-                ignore_divisions=True,
-            )
-        else:
-            dd.to_parquet(  # type: ignore[attr-defined]
-                df=common_dask_df,
-                path=parquet_subdir,
-            )
+        for filepath in iceflow_filepaths
+    ]
+    float_dtype = "float32" if store_float32 else "float64"
+    meta = pd.DataFrame(
+        {
+            "latitude": pd.Series(dtype=float_dtype),
+            "longitude": pd.Series(dtype=float_dtype),
+            "elevation": pd.Series(dtype=float_dtype),
+            "dataset": pd.Series(dtype="category"),
+        },
+        index=pd.DatetimeIndex([], name="utc_datetime"),
+    )
+    iceflow_dask_df = dd.from_delayed(partitions, meta=meta, verify_meta=False)  # type: ignore[attr-defined]
+    # The dataset of each file is not known until it is read.
+    iceflow_dask_df["dataset"] = iceflow_dask_df.dataset.cat.as_unknown()  # type: ignore[index, union-attr]
+    dd.to_parquet(  # type: ignore[attr-defined]
+        df=iceflow_dask_df,
+        path=parquet_subdir,
+    )
 
     return parquet_subdir
@@ -5,13 +5,13 @@ import logging
 import re
 from enum import Enum
 from pathlib import Path
+from typing import Any, Literal
 
 import h5py
 import numpy as np
 import pandas as pd
-import pandera as pa
 from gps_timemachine.gps import leap_seconds
-from numpy.typing import DTypeLike
+from numpy.typing import DTypeLike, NDArray
 
 from nsidc.iceflow.data.models import ATM1BDataFrame
 
@@ -81,33 +81,52 @@ class Endian(Enum):
     BIG = 2
 
 
+# QFIT dtypes by endianness and the number of fields in the file.
+_DATA_DTYPES = {
+    Endian.LITTLE: {
+        10: ATM1B_DTYPE_10_LE,
+        12: ATM1B_DTYPE_12_LE,
+        14: ATM1B_DTYPE_14_LE,
+    },
+    Endian.BIG: {
+        10: ATM1B_DTYPE_10_BE,
+        12: ATM1B_DTYPE_12_BE,
+        14: ATM1B_DTYPE_14_BE,
+    },
+}
+
+
 def _data_dtype(endianness: Endian, field_count: int) -> DTypeLike:
     """Return the appropriate QFIT dtype based on the given endianness and
     number of fields in the file."""
-    return {
-        Endian.LITTLE: {
-            10: ATM1B_DTYPE_10_LE,
-            12: ATM1B_DTYPE_12_LE,
-            14: ATM1B_DTYPE_14_LE,
-        },
-        Endian.BIG: {
-            10: ATM1B_DTYPE_10_BE,
-            12: ATM1B_DTYPE_12_BE,
-            14: ATM1B_DTYPE_14_BE,
-        },
-    }[endianness][field_count]
+    return _DATA_DTYPES[endianness][field_count]
 
 
-def _file_dtype(filepath: Path) -> DTypeLike:
-    """Return the dtype for the given file."""
-    data_endianness = Endian.BIG
+def _qfit_record_size(filepath: Path) -> tuple[int, Endian]:
+    """Return the record size (in bytes) and endianness of the given QFIT file.
+
+    The first word of a QFIT file is the record size, which is always less than
+    100 bytes. A larger value indicates that the file is little-endian.
+    """
+    # Only the first word is needed, so read it directly rather than with
+    # `np.fromfile`, which has a large per-call overhead.
+    with filepath.open("rb") as f:
+        first_word = f.read(4)
 
-    record_size = np.fromfile(filepath, dtype=">i4", count=1)[0]
+    record_size = int.from_bytes(first_word, "big", signed=True)
+    if record_size < 100:
+        return record_size, Endian.BIG
+
+    record_size = int.from_bytes(first_word, "little", signed=True)
     if record_size >= 100:
-        record_size = np.fromfile(filepath, dtype="<i4", count=1)[0]
-        if record_size >= 100:
-            raise ValueError("invalid record size found")
-        data_endianness = Endian.LITTLE
+        raise ValueError("invalid record size found")
+
+    return record_size, Endian.LITTLE
+
+
+def _file_dtype(filepath: Path) -> DTypeLike:
+    """Return the dtype for the given file."""
+    record_size, data_endianness = _qfit_record_size(filepath)
 
     field_count = int(record_size / 4)
 
@@ -116,15 +135,19 @@ def _file_dtype(filepath: Path) -> DTypeLike:
     return dtype
 
 
+BLATM1B_DATE_REGEX = re.compile(r"BLATM1B_(\d{8})")
+BLATM1B_SHORT_DATE_REGEX = re.compile(r"BLATM1B_(\d{6})")
+
+
 def _blatm1bv1_date(fn) -> dt.date:
     """Return the date from the given BLATM1B filename."""
     fn_date = None
 
-    m = re.search(r"BLATM1B_(\d{8})", fn)
+    m = BLATM1B_DATE_REGEX.search(fn)
     if m:
         fn_date_str = m.group(1)
     else:
-        m = re.search(r"BLATM1B_(\d{6})", fn)
+        m = BLATM1B_SHORT_DATE_REGEX.search(fn)
         if not m:
             err_msg = f"Failed to extract date from BLATM1B v1 file: {fn}"
             raise RuntimeError(err_msg)
@@ -140,9 +163,12 @@ def _blatm1bv1_date(fn) -> dt.date:
     return fn_date
 
 
+ILATM1B_DATE_REGEX = re.compile(r"_(\d{8})_")
+
+
 def _ilatm1b_date(fn: str) -> dt.date:
     """Return the date from the given ILATM1B filename."""
-    m = re.search(r"_(\d{8})_", fn)
+    m = ILATM1B_DATE_REGEX.search(fn)
     if not m:
         err = f"Failed to extract date from filepath: {fn}"
         raise RuntimeError(err)
@@ -150,47 +176,48 @@ def _ilatm1b_date(fn: str) -> dt.date:
     return dt.datetime.strptime(fn_date, "%Y%m%d").date()
 
 
-def _shift_lon(lon):
-    """Shifts longitude values from [0,360] to [-180,180]"""
-    if lon >= 180.0:
-        return lon - 360.0
+def _shift_lon(lon: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Shifts longitude values from [0,360] to [-180,180], in place."""
+    np.subtract(lon, 360.0, out=lon, where=lon >= 180.0)
     return lon
 
 
+# Fields that are only included in some of the ATM1B file formats.
+_OPTIONAL_FIELDS = (
+    "gps_pdop",
+    "pulse_width",
+    "passive_signal",
+    "passive_footprint_latitude",
+    "passive_footprint_longitude",
+    "passive_footprint_synthesized_elevation",
+)
+
+
 def _augment_with_optional_values(df, original_shape):
     """Add columns (w/ `np.nan`) to the dataframe depending on what fields
     the original data did not include.
     """
     rows, cols = original_shape
-    missing = np.full(shape=(rows,), fill_value=np.nan)
-
-    if cols == 10:
-        df["gps_pdop"] = missing
-        df["pulse_width"] = missing
-        df["passive_signal"] = missing
-        df["passive_footprint_latitude"] = missing
-        df["passive_footprint_longitude"] = missing
-        df["passive_footprint_synthesized_elevation"] = missing
-    elif cols == 12:
-        df["passive_signal"] = missing
-        df["passive_footprint_latitude"] = missing
-        df["passive_footprint_longitude"] = missing
-        df["passive_footprint_synthesized_elevation"] = missing
-    elif cols == 14:
-        df["gps_pdop"] = missing
-        df["pulse_width"] = missing
-    else:
+    if cols not in (10, 12, 14):
         raise ValueError("Unknown number of columns: cannot augment")
 
+    # All of the missing columns share a single array of NaNs.
+    missing = np.full(shape=(rows,), fill_value=np.nan)
+    for field in _OPTIONAL_FIELDS:
+        if field not in df.columns:
+            df[field] = missing
+
 
 def _strip_header(data):
     """Slice the header from the given data; skip the first row because we
     know it's a valid header; any rows with negative first elements
     are also header rows.
     """
-    idx = 1
-    while data[idx][0] < 0:
-        idx += 1
+    is_data = data["rel_time"][1:] >= 0
+    if not is_data.any():
+        return data[len(data) :]
+
+    idx = 1 + int(np.argmax(is_data))
 
     return data[idx:]
 
@@ -201,45 +228,75 @@ def _utc_datetime(
     """Return `utc_datetime` Series, with values calculated from the given
     date and the GPS time values, with a leap second adjustment to the GPS
     times.
+
+    GPS time values are packed as `hhmmssfff` (e.g., 153320100 is 15:33:20.100).
     """
-    tdf = pd.DataFrame()
-    tdf["hour"] = (gps_time / 1e7).astype(np.uint8)
-    tdf["minute"] = ((gps_time % 1e7) / 1e5).astype(np.uint8)
-    tdf["second"] = ((gps_time % 1e5) / 1e3).astype(np.uint8)
-    tdf["millisecond"] = (gps_time % 1e3).astype(np.uint16)
-    tdf["year"] = file_date.year
-    tdf["month"] = file_date.month
-    tdf["day"] = file_date.day
+    packed = gps_time.to_numpy(dtype=np.int64)
+    hours = packed // 10_000_000
+    minutes = (packed // 100_000) % 100
+    seconds = (packed // 1000) % 100
+    milliseconds = packed % 1000
+    offsets = ((hours * 60 + minutes) * 60 + seconds) * 1000 + milliseconds
 
     ls = int(leap_seconds(dt.datetime(file_date.year, file_date.month, file_date.day)))
-    utc = pd.to_datetime(tdf).to_numpy() - np.timedelta64(ls, "s")
+    start = np.datetime64(file_date, "ns") - np.timedelta64(ls, "s")
+    utc = start + offsets.astype("timedelta64[ms]")
 
     return pd.Series(utc)
 
 
+def _read_qfit_records(filepath: Path, dtype: np.dtype[Any]) -> NDArray[Any]:
+    """Read all of the (complete) records in the given QFIT file.
+
+    The file is read directly into a preallocated array with a single
+    `readinto` call, rather than through `np.fromfile`.
+    """
+    num_records = filepath.stat().st_size // dtype.itemsize
+    records = np.empty(num_records, dtype=dtype)
+    with filepath.open("rb") as f:
+        num_bytes = f.readinto(records.view(np.uint8))  # type: ignore[arg-type]
+
+    if num_bytes != records.nbytes:
+        err = f"Failed to read {records.nbytes} bytes from {filepath}"
+        raise RuntimeError(err)
+
+    return records
+
+
 def _atm1b_qfit_dataframe(filepath: Path) -> pd.DataFrame:
     """Read an ATM1B QFIT file into a DataFrame, stripping bad data if
     necessary.
     """
     dtype = _file_dtype(filepath)
 
-    raw_data = np.fromfile(filepath, dtype=dtype)
+    raw_data = _read_qfit_records(filepath, np.dtype(dtype))
     raw_data = _strip_header(raw_data)
 
+    # Convert the records to native byte order. The array was read from the
+    # file by this function, so its bytes can be swapped in place, without
+    # making a copy. Each field is then used as a column as-is, rather than
+    # pandas copying (and keeping the non-native byte order of) each field.
+    if not raw_data.dtype.isnative:
+        raw_data = raw_data.byteswap(inplace=True).view(
+            raw_data.dtype.newbyteorder("=")
+        )
+
     if dtype in (ATM1B_DTYPE_14_LE, ATM1B_DTYPE_14_BE):
         # Ignore records with invalid data (this occurs in the 14-word
         # format records containing passive brightness data)
         logging.info("Before filter. Data shape: %s", raw_data.shape)
-        raw_data = raw_data[
-            (raw_data["latitude"] != 0) & (raw_data["elevation"] != -9999)
-        ]
+        latitude = raw_data["latitude"]
+        elevation = raw_data["elevation"]
+        raw_data = raw_data[(latitude != 0) & (elevation != -9999)]
         logging.info("After filter. Data shape: %s", raw_data.shape)
 
         if raw_data.shape[0] == 0:
             logging.warning("After removal of bad data, file contains no valid data.")
             return pd.DataFrame()
 
-    return pd.DataFrame(raw_data)
+    fields = raw_data.dtype.names or ()
+
+    return pd.DataFrame({field: raw_data[field] for field in fields}, copy=False)
 
 
 def _atm1b_qfit_data(filepath: Path, file_date: dt.date) -> pd.DataFrame:
@@ -249,13 +306,18 @@ def _atm1b_qfit_data(filepath: Path, file_date: dt.date) -> pd.DataFrame:
     df = _atm1b_qfit_dataframe(filepath)
     original_shape = df.shape
 
-    df["latitude"] = df["latitude"] * 1e-6
-    df["longitude"] = df["longitude"] * 1e-6
-    df["longitude"] = df["longitude"].apply(_shift_lon)
+    # Each of the scaled columns is computed into a single new array, which is
+    # then modified in place, rather than making a copy for each step.
+    df["latitude"] = df["latitude"].to_numpy() * 1e-6
+    df["longitude"] = _shift_lon(df["longitude"].to_numpy() * 1e-6)
     # elevation values are natively stored as Meters 10**-3. We convert them
     # back to meters here.
-    df["elevation"] = df["elevation"] * 1e-3
-    df["elevation"] = df["elevation"].astype(np.float32)
+    df["elevation"] = np.multiply(
+        df["elevation"].to_numpy(),
+        1e-3,
+        out=np.empty(len(df), dtype=np.float32),
+        casting="same_kind",
+    )
     df["utc_datetime"] = _utc_datetime(df["gps_time"], file_date)
     _augment_with_optional_values(df, original_shape)
 
@@ -284,32 +346,34 @@ def _normalize_itrf_str(itrf_str: str) -> str:
 
 def _qfit_file_header(filepath: Path) -> str:
     """Return the header string from a QFIT file."""
-    record_size = np.fromfile(filepath, dtype=">i4", count=1)[0]
-    # The header length for each record is the number of bytes after the first
-    # word.
-    header_size = record_size - 4
-    dtype = np.dtype([("record_type", ">i4"), ("header", f">S{header_size}")])
-
-    if record_size >= 100:
-        record_size = np.fromfile(filepath, dtype="<i4", count=1)[0]
-        if record_size >= 100:
-            raise ValueError("invalid record size found")
-        header_size = record_size - 4
-        dtype = np.dtype([("record_type", "<i4"), ("header", f"<S{header_size}")])
+    record_size, endianness = _qfit_record_size(filepath)
+    byteorder: Literal["big", "little"] = (
+        "big" if endianness == Endian.BIG else "little"
+    )
 
-    raw_data = np.fromfile(filepath, dtype=dtype)
+    if filepath.stat().st_size <= 2 * record_size:
+        err = f"Failed to read qfit file header for {filepath}"
+        raise RuntimeError(err)
 
     # In 'normal' files with headers, we skip the first two records
-    # and only keep those whose record_type is negative.
-    if len(raw_data) > 2:
-        idx = 2
-        while raw_data[idx]["record_type"] < 0:
-            idx += 1
-        header = raw_data[2:idx]
-        return "".join([r["header"].decode("UTF-8") for r in header])
-
-    err = "Failed to read qfit file header for {filepath}"
-    raise RuntimeError(err)
+    # and only keep those whose record_type is negative. The header records are
+    # read one at a time so that the (much larger) data records that follow
+    # them are never read.
+    headers = []
+    with filepath.open("rb") as f:
+        f.seek(2 * record_size)
+        while len(record := f.read(record_size)) == record_size:
+            record_type = int.from_bytes(record[:4], byteorder, signed=True)
+            if record_type >= 0:
+                break
+            # The header length for each record is the number of bytes after
+            # the first word. Like numpy's bytes dtype, drop trailing nulls.
+            headers.append(record[4:].rstrip(b"\x00").decode("UTF-8"))
+
+    return "".join(headers)
+
+
+QFIT_HEADER_ITRF_REGEX = re.compile(r"itrf\d{2,4}")
 
 
 def _infer_qfit_itrf(filepath: Path) -> str:
@@ -332,7 +396,7 @@ def _infer_qfit_itrf(filepath: Path) -> str:
     data and that has the ITRF epoch in its file name."
     """
     header = _qfit_file_header(filepath)
-    results = re.finditer(r"itrf\d{2,4}", header)
+    results = QFIT_HEADER_ITRF_REGEX.finditer(header)
     itrfs = list({result.group() for result in results})
 
     if len(itrfs) == 1:
@@ -382,15 +446,22 @@ def _ilatm1bv2_dataframe(filepath: Path) -> pd.DataFrame:
         ("pulse_width", "instrument_parameters/pulse_width", 1, np.uint32),
         ("gps_time", "instrument_parameters/time_hhmmss", 1000, np.uint32),
     ]
-    df = pd.DataFrame()
+    columns = {}
     with h5py.File(filepath, "r") as atmv2:
         for key, name, scale_factor, dtype in variables:
+            dataset = atmv2[name]
+            values = np.empty(dataset.shape, dtype=dataset.dtype)
+            dataset.read_direct(values)
             if scale_factor and dtype:
-                df[key] = (atmv2[name][:] * scale_factor).astype(dtype)
-            else:
-                df[key] = atmv2[name][:]
+                # Scale the values in place, so that the only new array is the
+                # result of the type conversion.
+                values *= scale_factor
+                values = values.astype(dtype, copy=False)
+            columns[key] = values
 
-    return df
+    # Build the dataframe from all of the columns at once, rather than
+    # inserting them one at a time.
+    return pd.DataFrame(columns, copy=False)
 
 
 def _ilatm1bv2_data(fn: Path, file_date: dt.date) -> pd.DataFrame:
@@ -400,14 +471,16 @@ def _ilatm1bv2_data(fn: Path, file_date: dt.date) -> pd.DataFrame:
     df = _ilatm1bv2_dataframe(fn)
     original_shape = df.shape
 
-    df["longitude"] = df["longitude"].apply(_shift_lon)
+    df["longitude"] = _shift_lon(df["longitude"].to_numpy(copy=True))
     df["utc_datetime"] = _utc_datetime(df["gps_time"], file_date)
     _augment_with_optional_values(df, original_shape)
 
     return df
 
 
-@pa.check_types()
+ATM1B_FILENAME_YEAR_REGEX = re.compile(r".*_(\d{4})\d{4}.*")
+
+
 def atm1b_data(filepath: Path) -> ATM1BDataFrame:
     """
     Return the atm1b data given a filename.
@@ -430,7 +503,7 @@ def atm1b_data(filepath: Path) -> ATM1BDataFrame:
     filename = filepath.name
 
     # Find the date, which corresponds to the product version.
-    match = re.search(r".*_(\d{4})\d{4}.*", filename)
+    match = ATM1B_FILENAME_YEAR_REGEX.search(filename)
     if not match:
         err = f"Failed to recognize {filename} as ATM1B data."
         raise RuntimeError(err)
@@ -452,4 +525,6 @@ def atm1b_data(filepath: Path) -> ATM1BDataFrame:
 
     data = data.set_index("utc_datetime")
 
+    # Constructing the typed dataframe validates (and coerces) the data against
+    # the schema, so there is no need to also validate with `pa.check_types`.
     return ATM1BDataFrame(data)
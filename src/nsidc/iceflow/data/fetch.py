@@ -1,9 +1,14 @@
 from __future__ import annotations
 
 import datetime as dt
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import cast
 
 import earthaccess
+from earthaccess.results import DataGranule
 from loguru import logger
 
 from nsidc.iceflow.data.models import (
@@ -14,6 +19,43 @@ from nsidc.iceflow.data.models import (
     IceflowSearchResults,
 )
 
+# Number of times to re-attempt downloading granules that failed to download
+# (e.g., due to a transient HTTP 5xx error from the DAAC). The wait between
+# attempts doubles each time, starting from `_RETRY_BACKOFF_SECONDS`.
+_DOWNLOAD_RETRIES = 3
+_RETRY_BACKOFF_SECONDS = 1.0
+
+
+def _is_logged_in() -> bool:
+    """Return whether `earthaccess` is logged in to Earthdata."""
+    # Accessing `earthaccess.__auth__` first attempts a non-interactive login
+    # with credentials from the environment or netrc.
+    return bool(earthaccess.__auth__.authenticated)
+
+
+def _ensure_login() -> None:
+    """Log in to Earthdata with `earthaccess`, unless already logged in.
+
+    Logging in checks the environment and/or netrc for credentials and may
+    request a new token, so it is skipped once logged in. This is called before
+    any work is handed to worker threads.
+
+    `earthaccess.login` does not raise when it fails to log in, so a
+    `RuntimeError` is raised here instead. A later call tries to log in again.
+    """
+    if _is_logged_in():
+        return
+
+    earthaccess.login()
+
+    if not _is_logged_in():
+        err_msg = (
+            "Failed to log in to Earthdata. Provide Earthdata login credentials"
+            " with the `EARTHDATA_USERNAME` and `EARTHDATA_PASSWORD` environment"
+            " variables or a `~/.netrc` file."
+        )
+        raise RuntimeError(err_msg)
+
 
 def _find_iceflow_data(
     *,
@@ -21,8 +63,6 @@ def _find_iceflow_data(
     bounding_box: BoundingBox,
     temporal: tuple[dt.datetime | dt.date, dt.datetime | dt.date],
 ) -> IceflowSearchResult:
-    earthaccess.login()
-
     ctx_string = (
         f"{dataset.short_name=} {dataset.version=} with {bounding_box=} {temporal=}"
     )
@@ -49,14 +89,211 @@ def _find_iceflow_data(
         logger.warning(f"Found no results for {ctx_string}")
         granules_list = []
 
+    # Some granules are available both in the cloud and on ECS, so the same
+    # files may be listed by more than one granule. Only keep the first, so that
+    # those files are not downloaded more than once.
+    unique_granules = []
+    seen_filenames: set[str] = set()
+    for granule in granules_list:
+        filenames = _granule_filenames(granule)
+        # Granules without any data links have no files to compare, so they are
+        # never considered duplicates.
+        if filenames and seen_filenames.issuperset(filenames):
+            continue
+        seen_filenames.update(filenames)
+        unique_granules.append(granule)
+
+    if len(unique_granules) < num_results:
+        logger.info(
+            f"Dropped {num_results - len(unique_granules)} duplicate granules"
+            f" for {ctx_string}"
+        )
+    granules_list = unique_granules
+
     iceflow_search_result = IceflowSearchResult(dataset=dataset, granules=granules_list)
     return iceflow_search_result
 
 
+def _granule_filenames(granule: DataGranule) -> list[str]:
+    """Return the names of the files earthaccess writes for the given granule."""
+    return [link.split("/")[-1] for link in granule.data_links()]
+
+
+# Conversion factors from the CMR `SizeUnit` to bytes.
+_SIZE_UNIT_BYTES = {
+    "B": 1,
+    "KB": 1024,
+    "MB": 1024**2,
+    "GB": 1024**3,
+    "TB": 1024**4,
+}
+
+
+def _expected_file_sizes(granule: DataGranule) -> dict[str, int]:
+    """Return a mapping of filename to size in bytes reported by CMR for the
+    given granule.
+
+    Files without size information in the granule metadata are omitted.
+    """
+    try:
+        archive_info = granule["umm"]["DataGranule"][
+            "ArchiveAndDistributionInformation"
+        ]
+    except KeyError:
+        return {}
+
+    sizes = {}
+    for file_info in archive_info:
+        if "Name" not in file_info:
+            continue
+        if "SizeInBytes" in file_info:
+            sizes[file_info["Name"]] = int(file_info["SizeInBytes"])
+        elif "Size" in file_info and file_info.get("SizeUnit") in _SIZE_UNIT_BYTES:
+            sizes[file_info["Name"]] = int(
+                float(file_info["Size"]) * _SIZE_UNIT_BYTES[file_info["SizeUnit"]]
+            )
+
+    return sizes
+
+
+def _cached_filepaths(granule: DataGranule, output_subdir: Path) -> list[Path] | None:
+    """Return the local filepaths for the granule if it has already been
+    downloaded to `output_subdir`, otherwise `None`.
+
+    Files whose size on disk is smaller than the size reported by CMR are
+    assumed to be truncated (e.g., from an interrupted download), so that they
+    get downloaded again. They are only replaced once the new download has
+    succeeded.
+    """
+    expected_sizes = _expected_file_sizes(granule)
+    filepaths = [output_subdir / filename for filename in _granule_filenames(granule)]
+
+    cached = True
+    for filepath in filepaths:
+        if not filepath.is_file():
+            cached = False
+            continue
+
+        # CMR sizes given in e.g., MB are rounded, so only a file that is
+        # smaller than expected by more than that rounding is considered
+        # truncated.
+        expected_size = expected_sizes.get(filepath.name)
+        if expected_size is not None and filepath.stat().st_size < 0.99 * expected_size:
+            logger.warning(f"Downloading truncated file {filepath} again.")
+            cached = False
+
+    return filepaths if cached else None
+
+
+def _download_granules(
+    *,
+    granules: list[DataGranule],
+    output_subdir: Path,
+    max_workers: int,
+) -> list[Path]:
+    """Download the given granules to `output_subdir`.
+
+    `earthaccess` downloads the granules concurrently with a pool of
+    `max_workers` threads. Granules that fail to download are retried with
+    exponential backoff, whether they are downloaded over HTTPS or directly
+    from S3.
+
+    Granules are first downloaded to a temporary directory in `output_subdir`,
+    and their files are only moved into place once all of them have been
+    downloaded. Existing files in `output_subdir` (e.g., truncated or
+    force-refetched downloads) are therefore left alone if the download fails.
+    """
+    # When not logged in, `earthaccess.download` only logs an error and returns
+    # no results, which would otherwise be retried as if every download failed.
+    if not _is_logged_in():
+        err_msg = (
+            f"Cannot download granules to {output_subdir}: not logged in to"
+            " Earthdata. Log in with `earthaccess.login()`, or provide Earthdata"
+            " login credentials with the `EARTHDATA_USERNAME` and"
+            " `EARTHDATA_PASSWORD` environment variables or a `~/.netrc` file."
+        )
+        raise RuntimeError(err_msg)
+
+    # `earthaccess` skips files that already exist in the directory it
+    # downloads to, so downloading to a new directory also ensures that the
+    # granules are actually fetched.
+    with tempfile.TemporaryDirectory(prefix=".download-", dir=output_subdir) as tmp:
+        staging_dir = Path(tmp)
+        downloaded_filepaths: list[Path] = []
+        to_fetch = granules
+        last_error: Exception | None = None
+        for attempt in range(_DOWNLOAD_RETRIES + 1):
+            if attempt:
+                backoff = _RETRY_BACKOFF_SECONDS * 2 ** (attempt - 1)
+                logger.warning(
+                    f"Retrying download of {len(to_fetch)} granules in {backoff}s"
+                    f" (attempt {attempt} of {_DOWNLOAD_RETRIES})."
+                )
+                time.sleep(backoff)
+
+            # For HTTPS downloads, `earthaccess` returns the local filepath (as a
+            # `str`) for each successful download and the raised exception for
+            # each failed one. Direct S3 access returns `Path`s, but raises on
+            # the first failure instead, in which case the whole batch is
+            # retried.
+            try:
+                results = cast(
+                    list[str | Path | Exception],
+                    earthaccess.download(
+                        to_fetch, str(staging_dir), threads=max_workers
+                    ),
+                )
+            except Exception as e:
+                logger.warning(f"Failed to download granules to {output_subdir}: {e}")
+                last_error = e
+                results = []
+
+            fetched = set()
+            for result in results:
+                if isinstance(result, Exception):
+                    last_error = result
+                else:
+                    fetched.add(Path(result))
+
+            failed = []
+            for granule in to_fetch:
+                filenames = _granule_filenames(granule)
+                if all(staging_dir / filename in fetched for filename in filenames):
+                    for filename in filenames:
+                        # Replacing the file is atomic, so an existing file is
+                        # only ever replaced by a complete download.
+                        filepath = output_subdir / filename
+                        if (staging_dir / filename).is_file():
+                            (staging_dir / filename).replace(filepath)
+                        downloaded_filepaths.append(filepath)
+                    continue
+
+                # Remove any partially-written files so that they are not
+                # mistaken for complete downloads by the next attempt.
+                for filename in filenames:
+                    if staging_dir / filename not in fetched:
+                        (staging_dir / filename).unlink(missing_ok=True)
+                failed.append(granule)
+
+            if not failed:
+                break
+            to_fetch = failed
+        else:
+            err_msg = (
+                f"Failed to download {len(to_fetch)} granules to {output_subdir}"
+                f" after {_DOWNLOAD_RETRIES} retries."
+            )
+            raise RuntimeError(err_msg) from last_error
+
+    return downloaded_filepaths
+
+
 def _download_iceflow_search_result(
     *,
     iceflow_search_result: IceflowSearchResult,
     output_dir: Path,
+    max_workers: int = 8,
+    force_refetch: bool = False,
 ) -> list[Path]:
     # No granules found for this search result object.
     if not iceflow_search_result.granules:
@@ -64,20 +301,43 @@ def _download_iceflow_search_result(
     # short_name and version-based subdir for data.
     subdir_name = f"{iceflow_search_result.dataset.short_name}_{iceflow_search_result.dataset.version}"
     output_subdir = output_dir / subdir_name
+    output_subdir.mkdir(exist_ok=True)
 
-    logger.info(
-        f"Downloading {len(iceflow_search_result.granules)} granules"
-        f" to {output_subdir}."
-    )
+    # Granules that have already been downloaded to the output subdir are not
+    # fetched again unless `force_refetch` is given.
+    downloaded_filepaths = []
+    to_fetch = []
+    for granule in iceflow_search_result.granules:
+        if force_refetch:
+            # Existing files are replaced once the new download succeeds.
+            to_fetch.append(granule)
+            continue
 
-    output_subdir.mkdir(exist_ok=True)
-    downloaded_files = earthaccess.download(
-        iceflow_search_result.granules, str(output_subdir)
-    )
-    downloaded_filepaths = [Path(filepath_str) for filepath_str in downloaded_files]
+        cached_filepaths = _cached_filepaths(granule, output_subdir)
+        if cached_filepaths is None:
+            to_fetch.append(granule)
+        else:
+            downloaded_filepaths.extend(cached_filepaths)
+
+    if downloaded_filepaths:
+        logger.info(
+            f"Found {len(iceflow_search_result.granules) - len(to_fetch)}"
+            f" previously downloaded granules in {output_subdir}."
+        )
+
+    if to_fetch:
+        logger.info(f"Downloading {len(to_fetch)} granules to {output_subdir}.")
+        downloaded_filepaths.extend(
+            _download_granules(
+                granules=to_fetch,
+                output_subdir=output_subdir,
+                max_workers=max_workers,
+            )
+        )
     # There may be duplicate filepaths returned by earthaccess because of data
-    # existing both in the cloud and on ECS.
-    downloaded_filepaths = list(set(downloaded_filepaths))
+    # existing both in the cloud and on ECS. Unlike a set, `dict.fromkeys`
+    # keeps the filepaths in the order of the granules.
+    downloaded_filepaths = list(dict.fromkeys(downloaded_filepaths))
 
     return downloaded_filepaths
 
@@ -86,14 +346,22 @@ def find_iceflow_data(
     *,
     dataset_search_params: DatasetSearchParameters,
 ) -> IceflowSearchResults:
-    iceflow_search_results = []
-    for dataset in dataset_search_params.datasets:
-        iceflow_search_result = _find_iceflow_data(
-            dataset=dataset,
-            bounding_box=dataset_search_params.bounding_box,
-            temporal=dataset_search_params.temporal,
+    _ensure_login()
+
+    # The searches for each dataset are independent, so they are made
+    # concurrently.
+    datasets = dataset_search_params.datasets
+    with ThreadPoolExecutor(max_workers=max(1, len(datasets))) as executor:
+        iceflow_search_results = list(
+            executor.map(
+                lambda dataset: _find_iceflow_data(
+                    dataset=dataset,
+                    bounding_box=dataset_search_params.bounding_box,
+                    temporal=dataset_search_params.temporal,
+                ),
+                datasets,
+            )
         )
-        iceflow_search_results.append(iceflow_search_result)
 
     return iceflow_search_results
 
@@ -101,13 +369,36 @@ def find_iceflow_data(
 def download_iceflow_results(
     iceflow_search_results: IceflowSearchResults,
     output_dir: Path,
+    *,
+    max_workers: int = 8,
+    force_refetch: bool = False,
 ) -> list[Path]:
-    all_downloaded_files = []
-    for iceflow_search_result in iceflow_search_results:
-        downloaded_filepaths = _download_iceflow_search_result(
-            iceflow_search_result=iceflow_search_result,
-            output_dir=output_dir,
+    """Download the granules in the given search results to `output_dir`.
+
+    `max_workers` is the number of granules downloaded concurrently for each
+    search result. The search results themselves are also downloaded
+    concurrently.
+
+    Granules that already exist in `output_dir` (e.g., from a previous call to
+    this function) are not downloaded again. Use `force_refetch=True` to
+    download all granules regardless.
+    """
+    _ensure_login()
+
+    with ThreadPoolExecutor(
+        max_workers=max(1, len(iceflow_search_results))
+    ) as executor:
+        downloaded_filepaths = executor.map(
+            lambda iceflow_search_result: _download_iceflow_search_result(
+                iceflow_search_result=iceflow_search_result,
+                output_dir=output_dir,
+                max_workers=max_workers,
+                force_refetch=force_refetch,
+            ),
+            iceflow_search_results,
         )
-        all_downloaded_files.extend(downloaded_filepaths)
+        all_downloaded_files = [
+            filepath for filepaths in downloaded_filepaths for filepath in filepaths
+        ]
 
     return all_downloaded_files
@@ -7,7 +7,6 @@ from pathlib import Path
 
 import numpy as np
 import pandas as pd
-import pandera as pa
 
 from nsidc.iceflow.data.models import ILVIS2DataFrame
 
@@ -105,15 +104,13 @@ ILVIS2_LONGITUDE_FIELD_NAMES = ["CLON", "GLON", "HLON", "TLON"]
 
 
 def _file_date(filename: str) -> dt.date:
-    """Return the datetime from the ILVIS2 filename."""
-    return dt.datetime.strptime(filename[9:18], "%Y_%m%d").date()
+    """Return the datetime from the ILVIS2 filename.
 
-
-def _shift_lon(lon):
-    """Shift longitude values from [0,360] to [-180,180]"""
-    if lon >= 180.0:
-        return lon - 360.0
-    return lon
+    E.g., `ILVIS2_AQ2009_1025_R1408_055812.TXT` gives 2009-10-25.
+    """
+    # The date is at a fixed position in the filename (`YYYY_MMDD`), so it is
+    # sliced out directly rather than parsed with `strptime`.
+    return dt.date(int(filename[9:13]), int(filename[14:16]), int(filename[16:18]))
 
 
 def _add_utc_datetime(df: pd.DataFrame, file_date) -> pd.DataFrame:
@@ -121,8 +118,9 @@ def _add_utc_datetime(df: pd.DataFrame, file_date) -> pd.DataFrame:
     calculated from the given date and the `TIME` values in the
     dataset (seconds of the day).
     """
-    df["utc_datetime"] = pd.to_datetime(file_date)
-    df["utc_datetime"] = df["utc_datetime"] + pd.to_timedelta(df["TIME"], unit="s")
+    # Add the offsets to the (scalar) start of the day directly, rather than
+    # first filling a column with the start of the day.
+    df["utc_datetime"] = pd.Timestamp(file_date) + pd.to_timedelta(df["TIME"], unit="s")
 
     return df
 
@@ -132,11 +130,19 @@ def _scale_and_convert(df: pd.DataFrame, fields):
     the corresponding column in the DataFrame and convert the column
     type.
     """
-    for name, scale_factor, dtype in fields:
+    # Most fields share one of a couple of scale factors, so the columns with
+    # the same scale factor are scaled together.
+    names_by_scale_factor: dict[int, list[str]] = {}
+    for name, scale_factor, _dtype in fields:
         if scale_factor is not None:
-            df.loc[:, name] *= scale_factor
-        if dtype != df.dtypes[name]:
-            df[name] = df[name].astype(dtype)
+            names_by_scale_factor.setdefault(scale_factor, []).append(name)
+
+    for scale_factor, names in names_by_scale_factor.items():
+        df[names] = df[names] * scale_factor
+
+    # Convert all of the columns in a single call, rather than replacing the
+    # columns one at a time.
+    df = df.astype({name: dtype for name, _scale_factor, dtype in fields})
 
     return df
 
@@ -146,11 +152,27 @@ def _ilvis2_data(filepath: Path, file_date: dt.date, fields) -> pd.DataFrame:
     conversions / augmentation on the data.
     """
     field_names = [name for name, _, _ in fields]
-    df = pd.read_csv(filepath, sep=r"\s+", comment="#", names=field_names)
-
-    for col in ILVIS2_LONGITUDE_FIELD_NAMES:
-        if col in df.columns:
-            df[col] = df[col].apply(_shift_lon)
+    # All of the fields are numeric and are scaled and converted to their final
+    # types below, so they are all parsed as floats. This saves the parser from
+    # inferring each column's type.
+    df = pd.read_csv(
+        filepath,
+        sep=r"\s+",
+        comment="#",
+        names=field_names,
+        dtype=np.float64,
+    )
+
+    # Shift the longitudes from [0,360] to [-180,180] for all of the longitude
+    # columns in the file at once. Only values >= 180 are changed, so that the
+    # others are exactly as parsed (wrapping with modulo arithmetic would add
+    # floating point error to them).
+    longitude_names = [
+        name for name in ILVIS2_LONGITUDE_FIELD_NAMES if name in df.columns
+    ]
+    lons = df[longitude_names].to_numpy(copy=True)
+    np.subtract(lons, 360.0, out=lons, where=lons >= 180.0)
+    df[longitude_names] = lons
 
     df = _add_utc_datetime(df, file_date)
 
@@ -159,7 +181,9 @@ def _ilvis2_data(filepath: Path, file_date: dt.date, fields) -> pd.DataFrame:
     return df
 
 
-@pa.check_types()
+ILVIS2_FILENAME_YEAR_REGEX = re.compile(r"_\D{2}(\d{4})_")
+
+
 def ilvis2_data(filepath: Path) -> ILVIS2DataFrame:
     """Return the ilvis2 data given a filepath.
 
@@ -178,7 +202,7 @@ def ilvis2_data(filepath: Path) -> ILVIS2DataFrame:
 
     """
     filename = filepath.name
-    match = re.search(r"_\D{2}(\d{4})_", filename)
+    match = ILVIS2_FILENAME_YEAR_REGEX.search(filename)
     if not match:
         err = f"Failed to recognize {filename} as ILVIS2 data."
         raise RuntimeError(err)
@@ -218,4 +242,6 @@ def ilvis2_data(filepath: Path) -> ILVIS2DataFrame:
 
     data = data.set_index("utc_datetime")
 
+    # Constructing the typed dataframe validates (and coerces) the data against
+    # the schema, so there is no need to also validate with `pa.check_types`.
     return ILVIS2DataFrame(data)
@@ -3,39 +3,61 @@ from __future__ import annotations
 import datetime as dt
 from typing import Literal
 
+import pandas as pd
 import pandera as pa
 import pydantic
 from earthaccess.results import DataGranule
 from pandera.typing import DataFrame, Index, Series
 
-from nsidc.iceflow.itrf import ITRF_REGEX
+from nsidc.iceflow.itrf import check_itrf
 
 
 class CommonDataColumnsSchema(pa.DataFrameModel):
     utc_datetime: Index[pa.dtypes.DateTime] = pa.Field(check_name=True)
-    ITRF: Series[str] = pa.Field(str_matches=ITRF_REGEX.pattern)
+    # There are only a handful of distinct ITRFs in any dataframe, so they are
+    # stored as a categorical.
+    ITRF: Series[pd.CategoricalDtype] = pa.Field(coerce=True)
     latitude: Series[float] = pa.Field(coerce=True)
     longitude: Series[float] = pa.Field(coerce=True)
     elevation: Series[float] = pa.Field(coerce=True)
 
+    @pa.check("ITRF", name="valid_itrf")
+    def valid_itrf(cls, itrf: pd.Series[str]) -> pd.Series[bool]:
+        # The column has already been coerced to a categorical, so only its
+        # categories need to be matched against the ITRF regex. Checking the
+        # rows is then a membership test on the categorical codes.
+        valid_itrfs = [
+            value
+            for value in itrf.cat.categories
+            if isinstance(value, str) and check_itrf(value)
+        ]
+        return itrf.isin(valid_itrfs)
+
 
 class ATM1BSchema(CommonDataColumnsSchema):
-    # Data fields unique to ATM1B data.
-    rel_time: Series[float] = pa.Field(nullable=True, coerce=True)
-    xmt_sigstr: Series[float] = pa.Field(nullable=True, coerce=True)
-    rcv_sigstr: Series[float] = pa.Field(nullable=True, coerce=True)
-    azimuth: Series[float] = pa.Field(nullable=True, coerce=True)
-    pitch: Series[float] = pa.Field(nullable=True, coerce=True)
-    roll: Series[float] = pa.Field(nullable=True, coerce=True)
-    gps_pdop: Series[float] = pa.Field(nullable=True, coerce=True)
-    gps_time: Series[float] = pa.Field(nullable=True, coerce=True)
-    passive_signal: Series[float] = pa.Field(nullable=True, coerce=True)
-    passive_footprint_latitude: Series[float] = pa.Field(nullable=True, coerce=True)
-    passive_footprint_longitude: Series[float] = pa.Field(nullable=True, coerce=True)
-    passive_footprint_synthesized_elevation: Series[float] = pa.Field(
+    # Data fields unique to ATM1B data. These are stored as 32-bit integers in
+    # the source files, so they are kept as (nullable) `Int32` rather than
+    # being promoted to 64-bit floats. Fields that are not present in a given
+    # file format are null.
+    rel_time: Series[pd.Int32Dtype] = pa.Field(nullable=True, coerce=True)
+    xmt_sigstr: Series[pd.Int32Dtype] = pa.Field(nullable=True, coerce=True)
+    rcv_sigstr: Series[pd.Int32Dtype] = pa.Field(nullable=True, coerce=True)
+    azimuth: Series[pd.Int32Dtype] = pa.Field(nullable=True, coerce=True)
+    pitch: Series[pd.Int32Dtype] = pa.Field(nullable=True, coerce=True)
+    roll: Series[pd.Int32Dtype] = pa.Field(nullable=True, coerce=True)
+    gps_pdop: Series[pd.Int32Dtype] = pa.Field(nullable=True, coerce=True)
+    gps_time: Series[pd.Int32Dtype] = pa.Field(nullable=True, coerce=True)
+    passive_signal: Series[pd.Int32Dtype] = pa.Field(nullable=True, coerce=True)
+    passive_footprint_latitude: Series[pd.Int32Dtype] = pa.Field(
+        nullable=True, coerce=True
+    )
+    passive_footprint_longitude: Series[pd.Int32Dtype] = pa.Field(
         nullable=True, coerce=True
     )
-    pulse_width: Series[float] = pa.Field(nullable=True, coerce=True)
+    passive_footprint_synthesized_elevation: Series[pd.Int32Dtype] = pa.Field(
+        nullable=True, coerce=True
+    )
+    pulse_width: Series[pd.Int32Dtype] = pa.Field(nullable=True, coerce=True)
 
 
 # Note/TODO: the ILVIS2 data contain multiple sets of lat/lon/elev. The common
@@ -193,6 +215,11 @@ DatasetShortName = ATM1BShortName | Literal["ILVIS2"] | Literal["GLAH06"]
 
 
 class Dataset(pydantic.BaseModel):
+    # Datasets and bounding boxes are immutable (and therefore hashable), so
+    # they can be shared between search parameters (e.g., `ALL_DATASETS`) and
+    # used as cache keys.
+    model_config = pydantic.ConfigDict(frozen=True)
+
     short_name: DatasetShortName
     version: str
 
@@ -230,6 +257,8 @@ class GLAH06Dataset(Dataset):
 
 
 class BoundingBox(pydantic.BaseModel):
+    model_config = pydantic.ConfigDict(frozen=True)
+
     lower_left_lon: float
     lower_left_lat: float
     upper_right_lon: float
@@ -1,45 +1,242 @@
 from __future__ import annotations
 
+import functools
+import tempfile
+from collections.abc import Callable
+from concurrent.futures import Executor
 from pathlib import Path
+from typing import cast
 
+import dask.dataframe as dd
 import pandas as pd
+from dask.delayed import delayed
+from loguru import logger
+from pandas.api.types import union_categoricals
 
+from nsidc.iceflow import __version__
 from nsidc.iceflow.data.atm1b import atm1b_data
 from nsidc.iceflow.data.glah06 import glah06_data
 from nsidc.iceflow.data.ilvis2 import ilvis2_data
 from nsidc.iceflow.data.models import (
     ATM1BDataFrame,
+    ATM1BSchema,
+    CommonDataColumnsSchema,
     GLAH06DataFrame,
+    GLAH06Schema,
     IceflowDataFrame,
     ILVIS2DataFrame,
+    ILVIS2Schema,
 )
 
+# Name of the subdirectory of each dataset's data directory in which parsed
+# data files are cached.
+_CACHE_DIRNAME = ".iceflow_cache"
+
+# Mapping of dataset short name to the function that reads its data files.
+_READERS: dict[
+    str,
+    Callable[[Path], ATM1BDataFrame | ILVIS2DataFrame | GLAH06DataFrame],
+] = {
+    "ILATM1B": atm1b_data,
+    "BLATM1B": atm1b_data,
+    "ILVIS2": ilvis2_data,
+    "GLAH06": glah06_data,
+}
+
+# Mapping of dataset short name to the schema of the data returned by its
+# reader. Data read back from the cache are validated against it.
+_SCHEMAS: dict[str, type[CommonDataColumnsSchema]] = {
+    "ILATM1B": ATM1BSchema,
+    "BLATM1B": ATM1BSchema,
+    "ILVIS2": ILVIS2Schema,
+    "GLAH06": GLAH06Schema,
+}
+
 
 def read_iceflow_datafile(
     filepath: Path,
+    *,
+    columns: list[str] | None = None,
+    use_cache: bool = False,
 ) -> IceflowDataFrame | ATM1BDataFrame | ILVIS2DataFrame | GLAH06DataFrame:
+    """Read the given iceflow data file.
+
+    If `columns` is given, only those columns (and the `utc_datetime` index) are
+    returned.
+
+    If `use_cache` is `True`, the parsed data are cached as parquet in an
+    `.iceflow_cache` subdirectory next to the source file, and read back from
+    there (validated against the dataset's schema) by later calls. Only the
+    requested `columns` are read from the cache. The cache is keyed on the
+    iceflow version, and is ignored for source files that are newer than their
+    cached data.
+    """
     # iceflow data are expected to exist in a directory named like
     # `{short_name}_{version}`
     dataset_subdir = filepath.parent.name
     short_name, _version = dataset_subdir.split("_")
 
-    if short_name in ["ILATM1B", "BLATM1B"]:
-        return atm1b_data(filepath)
-    elif short_name == "ILVIS2":
-        return ilvis2_data(filepath)
-    elif short_name == "GLAH06":
-        return glah06_data(filepath)
-    else:
+    try:
+        reader = _READERS[short_name]
+    except KeyError as e:
         err_msg = f"Unrecognized dataset {short_name=} extracted from {filepath.parent}"
-        raise RuntimeError(err_msg)
+        raise RuntimeError(err_msg) from e
+
+    if not use_cache:
+        data = reader(filepath)
+        return data if columns is None else data[columns]
+
+    # The readers (and the dtypes of the data they return) may change between
+    # iceflow versions, so data cached by another version are not used.
+    cache_filepath = (
+        filepath.parent / _CACHE_DIRNAME / f"{filepath.name}.{__version__}.parquet"
+    )
+    if (
+        cache_filepath.is_file()
+        and cache_filepath.stat().st_mtime >= filepath.stat().st_mtime
+    ):
+        schema = _SCHEMAS[short_name].to_schema()
+        if columns is not None:
+            schema = schema.select_columns(columns)
+        return cast(
+            IceflowDataFrame,
+            schema.validate(pd.read_parquet(cache_filepath, columns=columns)),
+        )
+
+    data = reader(filepath)
+
+    try:
+        cache_filepath.parent.mkdir(exist_ok=True)
+        # Write to a temporary file first so that an interrupted write does not
+        # leave a partial cache file behind. Each writer gets its own temporary
+        # file, so that concurrent writers of the same cache file (e.g., other
+        # threads or processes) do not write over each other's data.
+        with tempfile.NamedTemporaryFile(
+            dir=cache_filepath.parent,
+            prefix=f"{cache_filepath.name}.",
+            suffix=".tmp",
+            delete=False,
+        ) as tmp_file:
+            tmp_filepath = Path(tmp_file.name)
+        try:
+            data.to_parquet(tmp_filepath)
+            tmp_filepath.replace(cache_filepath)
+        finally:
+            tmp_filepath.unlink(missing_ok=True)
+    except OSError as e:
+        logger.warning(f"Failed to cache parsed data for {filepath}: {e}")
+
+    # The source file is parsed (and cached) in full, so that later reads of
+    # other columns can also come from the cache.
+    if columns is not None:
+        return data[columns]
+
+    return data
+
+
+def _map_iceflow_datafiles(
+    read_func: Callable[[Path], pd.DataFrame],
+    filepaths: list[Path],
+    *,
+    executor: Executor | None = None,
+) -> IceflowDataFrame:
+    """Read each of the given data files with `read_func` and concatenate the
+    results into a single dataframe.
+
+    Files are read one at a time, unless an `executor` is given to read them
+    with.
+    """
+    if executor is None:
+        all_dfs = [read_func(filepath) for filepath in filepaths]
+    else:
+        all_dfs = list(executor.map(read_func, filepaths))
+
+    # Concatenating categoricals with different categories results in an object
+    # column, so give every file's ITRF column the same set of categories.
+    itrfs = union_categoricals([df.ITRF for df in all_dfs]).categories
+    for df in all_dfs:
+        df["ITRF"] = df.ITRF.cat.set_categories(itrfs)
+
+    # The per-file dataframes are not used after this point, so there is no need
+    # for pandas to make defensive copies of them before concatenating.
+    complete_df = pd.concat(all_dfs, copy=False, sort=False)  # type: ignore[call-overload]
+    # Each of the per-file dataframes has already been validated by its reader,
+    # so mark the result as conforming to the common schema instead of
+    # validating every row again.
+    complete_df.pandera.add_schema(CommonDataColumnsSchema.to_schema())
+
+    return cast(IceflowDataFrame, complete_df)
+
+
+def read_iceflow_datafiles(
+    filepaths: list[Path],
+    *,
+    executor: Executor | None = None,
+    use_cache: bool = False,
+) -> IceflowDataFrame:
+    """Read the given iceflow data files into a single dataframe.
+
+    Use `use_cache=True` to cache the parsed data from each file, so that
+    reading the same files again is faster (see `read_iceflow_datafile`).
+
+    By default, files are read one at a time. To read them in parallel, pass a
+    `concurrent.futures` executor (e.g., a `ProcessPoolExecutor`) as `executor`.
+
+    Note that on platforms that start worker processes with "spawn" (the default
+    on macOS and Windows), a `ProcessPoolExecutor` must only be created under an
+    `if __name__ == "__main__":` guard in the calling script. Starting worker
+    processes with "fork" from a program with other running threads (e.g., a
+    Jupyter kernel) can deadlock.
+    """
+    return _map_iceflow_datafiles(
+        functools.partial(read_iceflow_datafile, use_cache=use_cache),
+        filepaths,
+        executor=executor,
+    )
+
+
+# Columns shared by all iceflow datasets, as returned by
+# `read_iceflow_datafiles_lazy`.
+_COMMON_COLUMNS = ["latitude", "longitude", "elevation", "ITRF"]
+
+
+def _read_common_columns(filepath: Path, *, use_cache: bool) -> pd.DataFrame:
+    return read_iceflow_datafile(filepath, columns=_COMMON_COLUMNS, use_cache=use_cache)
+
+
+def read_iceflow_datafiles_lazy(
+    filepaths: list[Path],
+    *,
+    use_cache: bool = False,
+) -> dd.DataFrame:  # type: ignore[name-defined]
+    """Lazily read the given iceflow data files into a dask dataframe.
 
+    Each file becomes one partition of the returned dataframe and is only read
+    when that partition is computed, so memory use is bounded by the largest
+    file rather than the total size of the data. Unlike
+    `read_iceflow_datafiles`, only the lat/lon/elev and ITRF columns that are
+    common to all datasets are included. Use
+    `dask.dataframe.DataFrame.map_partitions` with `transform_itrf` to
+    transform the data into a common ITRF.
 
-def read_iceflow_datafiles(filepaths: list[Path]) -> IceflowDataFrame:
-    all_dfs = []
-    for filepath in filepaths:
-        df = read_iceflow_datafile(filepath)
-        all_dfs.append(df)
+    Use `use_cache=True` to cache the parsed data from each file (see
+    `read_iceflow_datafile`).
+    """
+    meta = pd.DataFrame(
+        {
+            "latitude": pd.Series(dtype="float64"),
+            "longitude": pd.Series(dtype="float64"),
+            "elevation": pd.Series(dtype="float64"),
+            "ITRF": pd.Series(dtype="category"),
+        },
+        index=pd.DatetimeIndex([], name="utc_datetime"),
+    )
+    partitions = [
+        delayed(_read_common_columns)(fp, use_cache=use_cache) for fp in filepaths
+    ]
 
-    complete_df = IceflowDataFrame(pd.concat(all_dfs))
+    ddf = dd.from_delayed(partitions, meta=meta, verify_meta=False)  # type: ignore[attr-defined]
+    # The ITRFs in each file are not known until it is read.
+    ddf["ITRF"] = ddf.ITRF.cat.as_unknown()  # type: ignore[index, union-attr]
 
-    return complete_df
+    return ddf
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-import calendar
-import datetime as dt
+from functools import lru_cache
 
+import numpy as np
+import numpy.typing as npt
 import pandas as pd
 import pandera as pa
 from pyproj import Transformer
@@ -13,28 +14,67 @@ from nsidc.iceflow.itrf import check_itrf
 from nsidc.iceflow.itrf.plate_boundaries import plate_name
 
 
-def _datetime_to_decimal_year(date):
-    """Stolen from
-    https://stackoverflow.com/questions/6451655/python-how-to-convert-datetime-dates-to-decimal-years,
-    with one modification: `calendar.timegm` is used to set the epoch instead of
-    `time.mktime`, which assumes local time.
+def _datetimes_to_decimal_years(
+    datetimes: pd.DatetimeIndex,
+) -> npt.NDArray[np.float64]:
+    """Return the decimal year of each of the given (UTC) datetimes.
+
+    E.g., 1993-07-02 12:00:00 is halfway through 1993, which gives a decimal
+    year of 1993.5.
     """
+    # Many points (e.g., the shots in a single scan of the laser) share the
+    # same timestamp, so the decimal year is only calculated once for each
+    # unique timestamp. `pd.factorize` finds these with a hash table rather
+    # than sorting, as `np.unique` would.
+    codes, timestamps = pd.factorize(
+        datetimes.to_numpy(dtype="datetime64[ns]"), use_na_sentinel=False
+    )
+    start_of_year = timestamps.astype("datetime64[Y]")
+    start_of_next_year = (start_of_year + 1).astype("datetime64[ns]")
+    years = start_of_year.astype(np.int64) + 1970
+    start_of_year = start_of_year.astype("datetime64[ns]")
+
+    fraction = (timestamps - start_of_year) / (start_of_next_year - start_of_year)
+
+    decimal_years: npt.NDArray[np.float64] = (years + fraction)[codes]
 
-    def sinceEpoch(date):
-        # returns seconds since epoch
-        return calendar.timegm(date.timetuple())
+    return decimal_years
 
-    s = sinceEpoch
 
-    year = date.year
-    startOfThisYear = dt.datetime(year=year, month=1, day=1)
-    startOfNextYear = dt.datetime(year=year + 1, month=1, day=1)
+@lru_cache(maxsize=128)
+def _get_transformer(
+    *,
+    source_itrf: str,
+    target_itrf: str,
+    target_epoch: str | None,
+    plate: str | None,
+) -> Transformer:
+    """Return a `Transformer` from the source to the target ITRF and, optionally,
+    epoch.
+
+    Constructing a `Transformer` requires PROJ to parse the pipeline and load
+    the ITRF init files, which is expensive relative to the transformation
+    itself. Transformers are cached so that repeated transformations (e.g.,
+    once per dataset in `make_iceflow_parquet`) reuse them.
+    """
+    plate_model_step = ""
+    if target_epoch:
+        plate_model_step = (
+            f"+step +inv +init={target_itrf}:{plate} +t_epoch={target_epoch} "
+        )
 
-    yearElapsed = s(date) - s(startOfThisYear)
-    yearDuration = s(startOfNextYear) - s(startOfThisYear)
-    fraction = yearElapsed / yearDuration
+    pipeline = (
+        f"+proj=pipeline +ellps=WGS84 "
+        f"+step +proj=unitconvert +xy_in=deg +xy_out=rad "
+        f"+step +proj=latlon "
+        f"+step +proj=cart "
+        f"+step +inv +init={target_itrf}:{source_itrf} "
+        f"{plate_model_step}"
+        f"+step +inv +proj=cart "
+        f"+step +proj=unitconvert +xy_in=rad +xy_out=deg"
+    )
 
-    return date.year + fraction
+    return Transformer.from_pipeline(pipeline)
 
 
 @pa.check_types()
@@ -57,54 +97,72 @@ def transform_itrf(
         )
         raise ValueError(err_msg)
 
-    transformed_chunks = []
-    for source_itrf, chunk in data.groupby(by="ITRF"):
-        # If the source ITRF is the same as the target for this chunk, skip transformation.
+    # Each source ITRF is transformed with a single call to PROJ over all of its
+    # points, selected with a mask on the factorized ITRF codes. The transformed
+    # values are written into copies of the lat/lon/elev arrays, which avoids
+    # splitting the data into per-ITRF groups and concatenating them again.
+    codes, source_itrfs = pd.factorize(data.ITRF)
+    if all(source_itrf == target_itrf for source_itrf in source_itrfs):
+        return data
+
+    # PROJ transforms contiguous float64 arrays in place without any further
+    # copies.
+    lons = data.longitude.to_numpy(dtype=np.float64, copy=True)
+    lats = data.latitude.to_numpy(dtype=np.float64, copy=True)
+    elevs = data.elevation.to_numpy(dtype=np.float64, copy=True)
+    decimalyears = _datetimes_to_decimal_years(pd.DatetimeIndex(data.index))
+    # TODO: Should we create a new decimalyears when doing an epoch
+    # propagation since PROJ doesn't do this?
+
+    for source_itrf_code, source_itrf in enumerate(source_itrfs):
+        # If the source ITRF is the same as the target, skip transformation.
         if source_itrf == target_itrf:
-            transformed_chunks.append(chunk)
             continue
 
-        plate_model_step = ""
-        if target_epoch:
-            if not plate:
-                plate = plate_name(Point(chunk.longitude.mean(), chunk.latitude.mean()))
-            plate_model_step = (
-                f"+step +inv +init={target_itrf}:{plate} +t_epoch={target_epoch} "
-            )
-
-        pipeline = (
-            f"+proj=pipeline +ellps=WGS84 "
-            f"+step +proj=unitconvert +xy_in=deg +xy_out=rad "
-            f"+step +proj=latlon "
-            f"+step +proj=cart "
-            f"+step +inv +init={target_itrf}:{source_itrf} "
-            f"{plate_model_step}"
-            f"+step +inv +proj=cart "
-            f"+step +proj=unitconvert +xy_in=rad +xy_out=deg"
-        )
+        mask = codes == source_itrf_code
 
-        transformer = Transformer.from_pipeline(pipeline)
+        # The plate determined for one source ITRF's points does not carry
+        # over to the next, which may be elsewhere.
+        source_plate = plate
+        if target_epoch and not source_plate:
+            source_plate = plate_name(Point(lons[mask].mean(), lats[mask].mean()))
 
-        decimalyears = (
-            chunk.reset_index().utc_datetime.apply(_datetime_to_decimal_year).to_numpy()
-        )
-        # TODO: Should we create a new decimalyears when doing an epoch
-        # propagation since PROJ doesn't do this?
-
-        lons, lats, elevs, _ = transformer.transform(
-            chunk.longitude,
-            chunk.latitude,
-            chunk.elevation,
-            decimalyears,
+        transformer = _get_transformer(
+            source_itrf=source_itrf,
+            target_itrf=target_itrf,
+            target_epoch=target_epoch,
+            plate=source_plate,
         )
 
-        transformed_chunk = chunk.copy()
-        transformed_chunk["latitude"] = lats
-        transformed_chunk["longitude"] = lons
-        transformed_chunk["elevation"] = elevs
-        transformed_chunk["ITRF"] = target_itrf
-        transformed_chunks.append(transformed_chunk)
+        if mask.all():
+            # All of the data are in this source ITRF, so transform the arrays
+            # directly.
+            transformer.transform(lons, lats, elevs, decimalyears, inplace=True)
+            continue
+
+        group_lons = lons[mask]
+        group_lats = lats[mask]
+        group_elevs = elevs[mask]
+        transformer.transform(
+            group_lons,
+            group_lats,
+            group_elevs,
+            decimalyears[mask],
+            inplace=True,
+        )
+        lons[mask] = group_lons
+        lats[mask] = group_lats
+        elevs[mask] = group_elevs
+
+    # `assign` would make a deep copy of every column. Only the lat/lon/elev and
+    # ITRF columns change, so the rest are shared with the input by starting
+    # from a shallow copy and replacing those columns.
+    transformed_df = data.copy(deep=False)
+    transformed_df["latitude"] = lats
+    transformed_df["longitude"] = lons
+    transformed_df["elevation"] = elevs
+    transformed_df["ITRF"] = pd.Categorical.from_codes(
+        np.zeros(len(data), dtype=np.int8), categories=pd.Index([target_itrf])
+    )
 
-    transformed_df = pd.concat(transformed_chunks)
-    transformed_df = transformed_df.reset_index().set_index("utc_datetime")
     return IceflowDataFrame(transformed_df)
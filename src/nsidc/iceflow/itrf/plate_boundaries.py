@@ -3,9 +3,9 @@ from __future__ import annotations
 from collections import namedtuple
 from functools import partial
 
+import shapely
 from shapely.affinity import translate
 from shapely.geometry.multipolygon import MultiPolygon
-from shapely.geometry.point import Point
 from shapely.geometry.polygon import Polygon
 from shapely.ops import transform
 
@@ -2533,6 +2533,11 @@ PLATES = [
     Plate(NAZC, NAZC_FALSE_EASTING, "NAZC"),
 ]
 
+# Preparing the plate polygons builds a spatial index of their edges, so that
+# testing whether a point is on a plate does not scan every edge.
+for _plate in PLATES:
+    shapely.prepare(_plate.polygon)
+
 
 def plate_name(point):
     """Determine the Tectonic plate name based on the lon/lat of the given
@@ -2541,8 +2546,7 @@ def plate_name(point):
     """
     x, y = point.coords.xy
     for polygon, fe, name in PLATES:
-        p = Point(*shift_lon(x[0] + fe, y[0]))
-        if polygon.intersects(p):
+        if shapely.intersects_xy(polygon, *shift_lon(x[0] + fe, y[0])):
             return name
 
     err_msg = f"Failed to find plate for {point}"
@@ -27,11 +27,26 @@ def unit(_ctx):
     )
 
 
-@task()
-def integration(_ctx):
-    """Run integration tests with pytest."""
+@task(
+    help={
+        "serial": "Run the tests one at a time, with live output (e.g., for debugging)."
+    }
+)
+def integration(_ctx, serial=False):
+    """Run integration tests with pytest.
+
+    The integration tests spend most of their time waiting on downloads, so
+    they are run concurrently with `pytest-xdist`. `pytest-xdist` does not
+    support `--capture=no`, so the output of each test is reported once the
+    tests have finished (`-rA`) instead of live.
+    """
+    if serial:
+        pytest_args = "--capture=no -n 0"
+    else:
+        pytest_args = "-n auto -rA"
+
     print_and_run(
-        f"PYTHONPATH={PROJECT_DIR}/src:$PYTHONPATH pytest tests/integration --capture=no",
+        f"PYTHONPATH={PROJECT_DIR}/src:$PYTHONPATH pytest tests/integration {pytest_args}",
         pty=True,
     )
 
@@ -65,7 +65,9 @@ def test_atm1b_ilatm1b(tmp_path):
     )
 
     complete_df = IceflowDataFrame(
-        pd.concat([results_ilatm1b_v1_2009, results_ilatm1b_v2_2014])
+        pd.concat(  # type: ignore[call-overload]
+            [results_ilatm1b_v1_2009, results_ilatm1b_v2_2014], copy=False
+        )
     )
 
     assert (complete_df.ITRF.unique() == target_itrf).all()
@@ -125,7 +127,9 @@ def test_ivlis2(tmp_path):
     assert (results_v2.ITRF == "ITRF2008").all()
 
     # test that v1 and 2 can be concatenated
-    complete_df = IceflowDataFrame(pd.concat([results_v1, results_v2]))
+    complete_df = IceflowDataFrame(
+        pd.concat([results_v1, results_v2], copy=False)  # type: ignore[call-overload]
+    )
 
     assert complete_df is not None
 
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+import pytest
+
+# Two records of synthetic ILVIS2 v1 (LVIS v1.0.4 format) data.
+_MOCK_ILVIS2_V1_DATA = """# LFID SHOTNUMBER TIME CLON CLAT ZC GLON GLAT ZG HLON HLAT ZH
+1 100 55812.5 250.0 -75.0 100.0 250.5 -75.1 99.0 250.0 -75.0 101.0
+2 101 55812.6 250.1 -75.0 100.0 250.6 -75.1 98.0 250.1 -75.0 101.0
+"""
+
+
+@pytest.fixture()
+def ilvis2_v1_filepaths(tmp_path):
+    data_dir = tmp_path / "ILVIS2_1"
+    data_dir.mkdir()
+
+    filepaths = []
+    for shot_time in ("055812", "055813", "055814"):
+        filepath = data_dir / f"ILVIS2_AQ2009_1025_R1408_{shot_time}.TXT"
+        filepath.write_text(_MOCK_ILVIS2_V1_DATA)
+        filepaths.append(filepath)
+
+    return filepaths
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import datetime as dt
+from concurrent.futures import ThreadPoolExecutor
+
+import dask.dataframe as dd
+import pandas as pd
+import pytest
+
+from nsidc.iceflow import api
+from nsidc.iceflow.api import fetch_iceflow_df, make_iceflow_parquet
+from nsidc.iceflow.data.models import (
+    BoundingBox,
+    DatasetSearchParameters,
+    ILVIS2Dataset,
+)
+from nsidc.iceflow.data.read import read_iceflow_datafiles
+from nsidc.iceflow.itrf.converter import transform_itrf
+
+
+def test_fetch_iceflow_df(ilvis2_v1_filepaths, tmp_path, monkeypatch):
+    monkeypatch.setattr(api, "find_iceflow_data", lambda **_kwargs: [])
+    monkeypatch.setattr(
+        api, "download_iceflow_results", lambda **_kwargs: ilvis2_v1_filepaths
+    )
+
+    result = fetch_iceflow_df(
+        dataset_search_params=DatasetSearchParameters(
+            datasets=[ILVIS2Dataset(version="1")],
+            bounding_box=BoundingBox(
+                lower_left_lon=-120.0,
+                lower_left_lat=-80.0,
+                upper_right_lon=-90.0,
+                upper_right_lat=-65.0,
+            ),
+            temporal=(dt.date(2009, 10, 25), dt.date(2009, 10, 26)),
+        ),
+        output_dir=tmp_path,
+        output_itrf="ITRF2014",
+    )
+
+    # Transforming each file as it is read gives the same result as
+    # transforming all of the data at once.
+    expected = transform_itrf(
+        data=read_iceflow_datafiles(ilvis2_v1_filepaths),
+        target_itrf="ITRF2014",
+    )
+    assert (result.ITRF == "ITRF2014").all()
+    assert result.elevation.to_list() == pytest.approx(expected.elevation.to_list())
+    assert result.latitude.to_list() == pytest.approx(expected.latitude.to_list())
+
+
+@pytest.mark.parametrize("output_itrf", [None, "ITRF2014"])
+def test_fetch_iceflow_df_executor(
+    ilvis2_v1_filepaths, tmp_path, monkeypatch, output_itrf
+):
+    monkeypatch.setattr(api, "find_iceflow_data", lambda **_kwargs: [])
+    monkeypatch.setattr(
+        api, "download_iceflow_results", lambda **_kwargs: ilvis2_v1_filepaths
+    )
+    dataset_search_params = DatasetSearchParameters(
+        datasets=[ILVIS2Dataset(version="1")],
+        bounding_box=BoundingBox(
+            lower_left_lon=-120.0,
+            lower_left_lat=-80.0,
+            upper_right_lon=-90.0,
+            upper_right_lat=-65.0,
+        ),
+        temporal=(dt.date(2009, 10, 25), dt.date(2009, 10, 26)),
+    )
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        result = fetch_iceflow_df(
+            dataset_search_params=dataset_search_params,
+            output_dir=tmp_path,
+            output_itrf=output_itrf,
+            executor=executor,
+        )
+
+    expected = fetch_iceflow_df(
+        dataset_search_params=dataset_search_params,
+        output_dir=tmp_path,
+        output_itrf=output_itrf,
+    )
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_make_iceflow_parquet(ilvis2_v1_filepaths):
+    data_dir = ilvis2_v1_filepaths[0].parent.parent
+
+    parquet_path = make_iceflow_parquet(data_dir=data_dir, target_itrf="ITRF2014")
+    result = dd.read_parquet(parquet_path).compute()  # type: ignore[attr-defined]
+
+    expected = transform_itrf(
+        data=read_iceflow_datafiles(ilvis2_v1_filepaths),
+        target_itrf="ITRF2014",
+    )
+    assert list(result.columns) == ["latitude", "longitude", "elevation", "dataset"]
+    assert result.dataset.dtype == "category"
+    assert (result.dataset == "ILVIS2v1").all()
+    assert sorted(result.elevation.to_list()) == pytest.approx(
+        sorted(expected.elevation.to_list())
+    )
+
+
+def test_make_iceflow_parquet_float32(ilvis2_v1_filepaths):
+    data_dir = ilvis2_v1_filepaths[0].parent.parent
+
+    parquet_path = make_iceflow_parquet(
+        data_dir=data_dir, target_itrf="ITRF2014", store_float32=True
+    )
+    result = dd.read_parquet(parquet_path).compute()  # type: ignore[attr-defined]
+
+    assert (result[["latitude", "longitude", "elevation"]].dtypes == "float32").all()
+    assert (result.dataset == "ILVIS2v1").all()
@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import datetime as dt
+
+import h5py
+import numpy as np
+import pandas as pd
+import pytest
+
+from nsidc.iceflow.data import atm1b
+from nsidc.iceflow.data.atm1b import (
+    ATM1B_DTYPE_10_BE,
+    ATM1B_DTYPE_12_BE,
+    ATM1B_DTYPE_12_LE,
+    ATM1B_DTYPE_14_BE,
+    _atm1b_qfit_data,
+    _atm1b_qfit_dataframe,
+    _augment_with_optional_values,
+    _blatm1bv1_date,
+    _file_dtype,
+    _ilatm1b_date,
+    _ilatm1bv2_dataframe,
+    _qfit_file_header,
+    _shift_lon,
+    _strip_header,
+    _utc_datetime,
+)
+
+
+def _write_mock_qfit_file(filepath, byteorder):
+    """Write a 12-word QFIT file with two header records and one data record."""
+    record_size = 48
+    header_dtype = np.dtype(
+        [("record_type", f"{byteorder}i4"), ("header", f"S{record_size - 4}")]
+    )
+    records = np.array(
+        [
+            (record_size, b""),
+            (-9000008, b"not part of the header"),
+            (-9000001, b"./091109_aa_l12_cfm_"),
+            (-9000002, b"itrf05_18may10"),
+            (1, b"data"),
+        ],
+        dtype=header_dtype,
+    )
+    records.tofile(filepath)
+
+
+@pytest.mark.parametrize(
+    ("byteorder", "expected_dtype"),
+    [(">", ATM1B_DTYPE_12_BE), ("<", ATM1B_DTYPE_12_LE)],
+)
+def test_qfit_file_header(tmp_path, byteorder, expected_dtype):
+    filepath = tmp_path / "ILATM1B_20091109_000000.atm4cT3.qi"
+    _write_mock_qfit_file(filepath, byteorder)
+
+    assert _file_dtype(filepath) == expected_dtype
+    assert _qfit_file_header(filepath) == "./091109_aa_l12_cfm_itrf05_18may10"
+
+
+@pytest.mark.parametrize("byteorder", [">", "<"])
+def test__atm1b_qfit_dataframe(tmp_path, byteorder):
+    filepath = tmp_path / "ILATM1B_20091109_000000.atm4cT3.qi"
+    _write_mock_qfit_file(filepath, byteorder)
+
+    result = _atm1b_qfit_dataframe(filepath)
+
+    # Only the data record is kept, and the columns are in native byte order.
+    assert list(result.columns) == list(ATM1B_DTYPE_12_BE.names or ())
+    assert (result.dtypes == np.dtype(np.int32)).all()
+    assert result.rel_time.to_list() == [1]
+
+
+def test__shift_lon():
+    result = _shift_lon(np.array([0.0, 179.9, 180.0, 310.5, -50.0, np.nan]))
+
+    np.testing.assert_array_equal(result, [0.0, 179.9, -180.0, -49.5, -50.0, np.nan])
+
+
+def test__utc_datetime(monkeypatch):
+    # GPS time was 15 seconds ahead of UTC in 2009.
+    monkeypatch.setattr(atm1b, "leap_seconds", lambda _date: 15)
+
+    result = _utc_datetime(
+        pd.Series([153320100, 0, 235959999], dtype=np.uint32), dt.date(2009, 11, 9)
+    )
+
+    expected = pd.Series(
+        pd.to_datetime(
+            [
+                "2009-11-09 15:33:05.100",
+                "2009-11-08 23:59:45.000",
+                "2009-11-09 23:59:44.999",
+            ]
+        )
+    )
+    pd.testing.assert_series_equal(result, expected)
+
+
+def test__strip_header():
+    data = np.zeros(5, dtype=ATM1B_DTYPE_12_LE)
+    data["rel_time"] = [48, -9000008, -9000001, 1, -1]
+
+    # Only the contiguous header records following the first record are
+    # stripped.
+    assert _strip_header(data)["rel_time"].tolist() == [1, -1]
+    assert len(_strip_header(data[:3])) == 0
+
+
+def test__ilatm1bv2_dataframe(tmp_path):
+    filepath = tmp_path / "ILATM1B_20140430_110310.ATM4BT4.h5"
+    with h5py.File(filepath, "w") as atmv2:
+        atmv2["latitude"] = np.array([70.5, 70.6])
+        atmv2["longitude"] = np.array([310.5, 310.6])
+        atmv2["elevation"] = np.array([1000.5, 1000.6], dtype=np.float32)
+        params = atmv2.create_group("instrument_parameters")
+        params["rel_time"] = np.array([0.001, 0.002])
+        params["xmt_sigstr"] = np.array([1, 2], dtype=np.int32)
+        params["rcv_sigstr"] = np.array([3, 4], dtype=np.int32)
+        params["azimuth"] = np.array([1.5, 2.5])
+        params["pitch"] = np.array([-1.5, 0.5])
+        params["roll"] = np.array([0.25, 0.75])
+        params["gps_pdop"] = np.array([1.2, 1.3], dtype=np.float32)
+        params["pulse_width"] = np.array([7, 8], dtype=np.uint8)
+        params["time_hhmmss"] = np.array([110310.5, 110311.0])
+
+    result = _ilatm1bv2_dataframe(filepath)
+
+    assert result.latitude.to_list() == [70.5, 70.6]
+    assert result.elevation.dtype == np.float32
+    assert result.rel_time.to_list() == [1, 2]
+    assert result.rel_time.dtype == np.int32
+    assert result.pitch.to_list() == [-1500, 500]
+    assert result.gps_pdop.to_list() == [12, 13]
+    assert result.pulse_width.dtype == np.uint32
+    assert result.gps_time.to_list() == [110310500, 110311000]
+
+
+@pytest.mark.parametrize(
+    ("filename", "expected"),
+    [
+        ("BLATM1B_20060522_145449.qi", dt.date(2006, 5, 22)),
+        ("BLATM1B_20041127atm2_210316jr.lutF.qi", dt.date(2004, 11, 27)),
+        ("BLATM1B_970520_123456.qi", dt.date(1997, 5, 20)),
+    ],
+)
+def test__blatm1bv1_date(filename, expected):
+    assert _blatm1bv1_date(filename) == expected
+
+
+def test__ilatm1b_date():
+    assert _ilatm1b_date("ILATM1B_20111104_181304.ATM4BT4.qi") == dt.date(2011, 11, 4)
+
+
+def test__atm1b_qfit_data(tmp_path, monkeypatch):
+    monkeypatch.setattr(atm1b, "leap_seconds", lambda _date: 15)
+    records = np.zeros(5, dtype=ATM1B_DTYPE_12_BE)
+    records["rel_time"] = [48, -9000008, -9000001, 1, 2]
+    records["latitude"][3:] = [70_500_000, 70_600_000]
+    records["longitude"][3:] = [310_500_000, 10_500_000]
+    records["elevation"][3:] = [1_000_500, -2_250]
+    records["gps_time"][3:] = [153320100, 153320200]
+    filepath = tmp_path / "ILATM1B_20091109_153320.atm4cT3.qi"
+    records.tofile(filepath)
+
+    result = _atm1b_qfit_data(filepath, dt.date(2009, 11, 9))
+
+    assert result.latitude.to_list() == pytest.approx([70.5, 70.6])
+    assert result.longitude.to_list() == pytest.approx([-49.5, 10.5])
+    assert result.elevation.dtype == np.float32
+    assert result.elevation.to_list() == pytest.approx([1000.5, -2.25])
+    assert result.utc_datetime.to_list() == [
+        pd.Timestamp("2009-11-09 15:33:05.100"),
+        pd.Timestamp("2009-11-09 15:33:05.200"),
+    ]
+
+
+def test__atm1b_qfit_dataframe_filters_invalid_records(tmp_path):
+    records = np.zeros(5, dtype=ATM1B_DTYPE_14_BE)
+    records["rel_time"] = [56, -9000008, 1, 2, 3]
+    records["latitude"] = [0, 0, 70_500_000, 0, 70_600_000]
+    records["elevation"] = [0, 0, 1_000, 1_000, -9999]
+    filepath = tmp_path / "ILATM1B_20091109_153320.atm4cT3.qi"
+    records.tofile(filepath)
+
+    result = _atm1b_qfit_dataframe(filepath)
+
+    # Records without a latitude or with the -9999 fill value for elevation are
+    # dropped.
+    assert result.rel_time.to_list() == [1]
+    assert result.latitude.dtype == np.int32
+
+
+@pytest.mark.parametrize(
+    "dtype", [ATM1B_DTYPE_10_BE, ATM1B_DTYPE_12_BE, ATM1B_DTYPE_14_BE]
+)
+def test__augment_with_optional_values(dtype):
+    df = pd.DataFrame(np.zeros(2, dtype=dtype).astype(dtype.newbyteorder("=")))
+
+    _augment_with_optional_values(df, df.shape)
+
+    # Every format ends up with the same set of fields.
+    assert sorted(df.columns) == sorted(
+        set(ATM1B_DTYPE_12_BE.names or ()) | set(ATM1B_DTYPE_14_BE.names or ())
+    )
+    added = df.columns.difference(list(dtype.names or ()))
+    assert df[added].isna().all(axis=None)
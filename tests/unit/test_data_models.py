@@ -1,10 +1,18 @@
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 import pandera as pa
+import pydantic
 import pytest
 
-from nsidc.iceflow.data.models import IceflowDataFrame
+from nsidc.iceflow.data.models import (
+    ALL_DATASETS,
+    ATM1BDataFrame,
+    BoundingBox,
+    IceflowDataFrame,
+    ILATM1BDataset,
+)
 
 _mock_bad_df = pd.DataFrame(
     {
@@ -45,3 +53,56 @@ def _pa_check_out(df: pd.DataFrame) -> IceflowDataFrame:
 def test_pa_check_out():
     with pytest.raises(pa.errors.SchemaError):
         _pa_check_out(_mock_bad_df)
+
+
+def test_atm1bdataframe_int32():
+    df = pd.DataFrame(
+        {
+            "latitude": [70.0, 70.1],
+            "longitude": [-50.0, -50.1],
+            "elevation": [1.0, 2.0],
+            "ITRF": ["ITRF2005", "ITRF2005"],
+            "rel_time": np.array([1, 2], dtype=np.int32),
+            "xmt_sigstr": np.array([1, 2], dtype=np.int32),
+            "rcv_sigstr": np.array([1, 2], dtype=np.int32),
+            "azimuth": np.array([1, 2], dtype=np.int32),
+            "pitch": np.array([1, 2], dtype=np.int32),
+            "roll": np.array([1, 2], dtype=np.int32),
+            "gps_pdop": np.array([1, 2], dtype=np.int32),
+            "pulse_width": np.array([1, 2], dtype=np.uint32),
+            "gps_time": np.array([235959000, 235959001], dtype=np.uint32),
+            # Fields missing from the source file are filled with `np.nan`.
+            "passive_signal": [np.nan, np.nan],
+            "passive_footprint_latitude": [np.nan, np.nan],
+            "passive_footprint_longitude": [np.nan, np.nan],
+            "passive_footprint_synthesized_elevation": [np.nan, np.nan],
+        },
+        index=pd.DatetimeIndex(
+            ["2009-11-04 18:13:04", "2009-11-04 18:13:05"], name="utc_datetime"
+        ),
+    )
+
+    result = ATM1BDataFrame(df)
+
+    assert (
+        result.dtypes.drop(["latitude", "longitude", "elevation", "ITRF"]) == "Int32"
+    ).all()
+    assert result.gps_time.to_list() == [235959000, 235959001]
+    assert result.passive_signal.isna().all()
+
+
+_bbox_kwargs = {
+    "lower_left_lon": -103.125559,
+    "lower_left_lat": -75.180563,
+    "upper_right_lon": -102.677327,
+    "upper_right_lat": -74.798063,
+}
+
+
+def test_dataset_and_bounding_box_hashable():
+    assert ILATM1BDataset(version="1") == ILATM1BDataset(version="1")
+    assert len({ILATM1BDataset(version="1"), ILATM1BDataset(version="1")}) == 1
+    assert hash(BoundingBox(**_bbox_kwargs)) == hash(BoundingBox(**_bbox_kwargs))
+
+    with pytest.raises(pydantic.ValidationError):
+        ALL_DATASETS[0].version = "2"
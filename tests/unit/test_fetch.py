@@ -0,0 +1,350 @@
+from __future__ import annotations
+
+import datetime as dt
+import time
+from pathlib import Path
+
+import earthaccess
+import pytest
+from earthaccess.results import DataGranule
+
+from nsidc.iceflow.data import fetch
+from nsidc.iceflow.data.fetch import (
+    _download_iceflow_search_result,
+    _find_iceflow_data,
+    find_iceflow_data,
+)
+from nsidc.iceflow.data.models import (
+    BoundingBox,
+    DatasetSearchParameters,
+    IceflowSearchResult,
+    ILATM1BDataset,
+    ILVIS2Dataset,
+)
+
+
+def _mock_granule(filename: str, size_in_bytes: int = 7) -> DataGranule:
+    return DataGranule(
+        {
+            "meta": {"concept-id": f"G-{filename}"},
+            "umm": {
+                "RelatedUrls": [
+                    {
+                        "URL": f"https://n5eil01u.ecs.nsidc.org/{filename}",
+                        "Type": "GET DATA",
+                    }
+                ],
+                "DataGranule": {
+                    "ArchiveAndDistributionInformation": [
+                        {"Name": filename, "SizeInBytes": size_in_bytes},
+                    ],
+                },
+            },
+        }
+    )
+
+
+@pytest.fixture()
+def _logged_in(monkeypatch):
+    monkeypatch.setattr(fetch, "_is_logged_in", lambda: True)
+
+
+@pytest.mark.usefixtures("_logged_in")
+def test__download_iceflow_search_result_retries_failures(tmp_path, monkeypatch):
+    monkeypatch.setattr(fetch, "_RETRY_BACKOFF_SECONDS", 0)
+    attempts = []
+
+    def _mock_download(granules, local_path, **_kwargs):
+        attempts.append(len(granules))
+        results: list[str | Path | Exception] = []
+        for granule in granules:
+            filename = granule.data_links()[0].split("/")[-1]
+            filepath = Path(local_path) / filename
+            filepath.write_bytes(b"partial")
+            # Fail the first attempt for the second granule.
+            if filename == "granule2.qi" and len(attempts) == 1:
+                results.append(Exception())
+            elif filename == "granule2.qi":
+                # Files downloaded directly from S3 are returned as `Path`s.
+                results.append(filepath)
+            else:
+                results.append(str(filepath))
+        return results
+
+    monkeypatch.setattr(earthaccess, "download", _mock_download)
+
+    downloaded = _download_iceflow_search_result(
+        iceflow_search_result=IceflowSearchResult(
+            dataset=ILATM1BDataset(version="1"),
+            granules=[_mock_granule("granule1.qi"), _mock_granule("granule2.qi")],
+        ),
+        output_dir=tmp_path,
+    )
+
+    assert attempts == [2, 1]
+    assert sorted(path.name for path in downloaded) == ["granule1.qi", "granule2.qi"]
+
+
+@pytest.mark.usefixtures("_logged_in")
+def test__download_iceflow_search_result_raises_after_retries(tmp_path, monkeypatch):
+    monkeypatch.setattr(fetch, "_RETRY_BACKOFF_SECONDS", 0)
+
+    def _mock_download(granules, _local_path, **_kwargs):
+        return [Exception() for _ in granules]
+
+    monkeypatch.setattr(earthaccess, "download", _mock_download)
+
+    with pytest.raises(RuntimeError):
+        _download_iceflow_search_result(
+            iceflow_search_result=IceflowSearchResult(
+                dataset=ILATM1BDataset(version="1"),
+                granules=[_mock_granule("granule1.qi")],
+            ),
+            output_dir=tmp_path,
+        )
+
+
+@pytest.mark.usefixtures("_logged_in")
+def test__download_iceflow_search_result_retries_s3_errors(tmp_path, monkeypatch):
+    monkeypatch.setattr(fetch, "_RETRY_BACKOFF_SECONDS", 0)
+    attempts = []
+
+    def _mock_download(granules, local_path, **_kwargs):
+        attempts.append(len(granules))
+        # Direct S3 access raises rather than returning the exception.
+        if len(attempts) == 1:
+            raise OSError
+        filepath = Path(local_path) / "granule1.qi"
+        filepath.write_bytes(b"granule")
+        return [filepath]
+
+    monkeypatch.setattr(earthaccess, "download", _mock_download)
+
+    downloaded = _download_iceflow_search_result(
+        iceflow_search_result=IceflowSearchResult(
+            dataset=ILATM1BDataset(version="1"),
+            granules=[_mock_granule("granule1.qi")],
+        ),
+        output_dir=tmp_path,
+    )
+
+    assert attempts == [1, 1]
+    assert [path.name for path in downloaded] == ["granule1.qi"]
+
+
+def test__download_iceflow_search_result_not_logged_in(tmp_path, monkeypatch):
+    monkeypatch.setattr(fetch, "_is_logged_in", lambda: False)
+
+    def _fail(*_args, **_kwargs):
+        raise AssertionError
+
+    monkeypatch.setattr(earthaccess, "download", _fail)
+    monkeypatch.setattr(time, "sleep", _fail)
+
+    # Downloading fails straight away, rather than retrying.
+    with pytest.raises(RuntimeError, match="not logged in"):
+        _download_iceflow_search_result(
+            iceflow_search_result=IceflowSearchResult(
+                dataset=ILATM1BDataset(version="1"),
+                granules=[_mock_granule("granule1.qi")],
+            ),
+            output_dir=tmp_path,
+        )
+
+
+@pytest.mark.usefixtures("_logged_in")
+def test__download_iceflow_search_result_skips_cached(tmp_path, monkeypatch):
+    fetched = []
+
+    def _mock_download(granules, local_path, **_kwargs):
+        results: list[str | Exception] = []
+        for granule in granules:
+            filename = granule.data_links()[0].split("/")[-1]
+            filepath = Path(local_path) / filename
+            filepath.write_bytes(b"granule")
+            fetched.append(filename)
+            results.append(str(filepath))
+        return results
+
+    monkeypatch.setattr(earthaccess, "download", _mock_download)
+
+    cached = tmp_path / "ILATM1B_1" / "cached.qi"
+    truncated = tmp_path / "ILATM1B_1" / "truncated.qi"
+    cached.parent.mkdir()
+    cached.write_bytes(b"granule")
+    truncated.write_bytes(b"gran")
+
+    iceflow_search_result = IceflowSearchResult(
+        dataset=ILATM1BDataset(version="1"),
+        granules=[
+            _mock_granule("cached.qi"),
+            _mock_granule("truncated.qi"),
+            _mock_granule("new.qi"),
+        ],
+    )
+    downloaded = _download_iceflow_search_result(
+        iceflow_search_result=iceflow_search_result,
+        output_dir=tmp_path,
+    )
+
+    assert sorted(fetched) == ["new.qi", "truncated.qi"]
+    assert sorted(path.name for path in downloaded) == [
+        "cached.qi",
+        "new.qi",
+        "truncated.qi",
+    ]
+
+    fetched.clear()
+    _download_iceflow_search_result(
+        iceflow_search_result=iceflow_search_result,
+        output_dir=tmp_path,
+        force_refetch=True,
+    )
+
+    assert sorted(fetched) == ["cached.qi", "new.qi", "truncated.qi"]
+
+
+@pytest.mark.usefixtures("_logged_in")
+def test__download_iceflow_search_result_keeps_files_on_failure(tmp_path, monkeypatch):
+    monkeypatch.setattr(fetch, "_RETRY_BACKOFF_SECONDS", 0)
+
+    def _mock_download(granules, local_path, **_kwargs):
+        results: list[str | Exception] = []
+        for granule in granules:
+            filename = granule.data_links()[0].split("/")[-1]
+            # Leave a partial download behind for every granule.
+            (Path(local_path) / filename).write_bytes(b"gr")
+            results.append(Exception())
+        return results
+
+    monkeypatch.setattr(earthaccess, "download", _mock_download)
+
+    cached = tmp_path / "ILATM1B_1" / "cached.qi"
+    truncated = tmp_path / "ILATM1B_1" / "truncated.qi"
+    cached.parent.mkdir()
+    cached.write_bytes(b"granule")
+    truncated.write_bytes(b"gran")
+
+    with pytest.raises(RuntimeError):
+        _download_iceflow_search_result(
+            iceflow_search_result=IceflowSearchResult(
+                dataset=ILATM1BDataset(version="1"),
+                granules=[_mock_granule("cached.qi"), _mock_granule("truncated.qi")],
+            ),
+            output_dir=tmp_path,
+            force_refetch=True,
+        )
+
+    # The existing files are untouched by the failed downloads, and the
+    # partial downloads are cleaned up.
+    assert cached.read_bytes() == b"granule"
+    assert truncated.read_bytes() == b"gran"
+    assert sorted(path.name for path in cached.parent.iterdir()) == [
+        "cached.qi",
+        "truncated.qi",
+    ]
+
+
+def test__find_iceflow_data_drops_duplicates(monkeypatch):
+    monkeypatch.setattr(
+        earthaccess,
+        "search_data",
+        lambda **_kwargs: [
+            _mock_granule("granule1.qi"),
+            _mock_granule("granule2.qi"),
+            # The same file available from another provider.
+            _mock_granule("granule1.qi"),
+        ],
+    )
+
+    result = _find_iceflow_data(
+        dataset=ILATM1BDataset(version="1"),
+        bounding_box=BoundingBox(
+            lower_left_lon=-180,
+            lower_left_lat=-90,
+            upper_right_lon=180,
+            upper_right_lat=90,
+        ),
+        temporal=(dt.date(2009, 1, 1), dt.date(2009, 12, 31)),
+    )
+
+    assert [granule.data_links() for granule in result.granules] == [
+        ["https://n5eil01u.ecs.nsidc.org/granule1.qi"],
+        ["https://n5eil01u.ecs.nsidc.org/granule2.qi"],
+    ]
+
+
+def test__ensure_login_retries_failed_login(monkeypatch):
+    logins: list[bool] = []
+    monkeypatch.setattr(fetch, "_is_logged_in", lambda: len(logins) > 1)
+    monkeypatch.setattr(earthaccess, "login", lambda: logins.append(True))
+
+    # `earthaccess.login` does not raise if it fails to log in.
+    with pytest.raises(RuntimeError, match="Failed to log in"):
+        fetch._ensure_login()
+
+    # A failed login is not remembered, so the next call tries again. Once
+    # logged in, there is no need to log in again.
+    fetch._ensure_login()
+    fetch._ensure_login()
+
+    assert logins == [True, True]
+
+
+def test__find_iceflow_data_keeps_granules_without_links(monkeypatch):
+    granule_without_links = _mock_granule("granule2.qi")
+    granule_without_links["umm"]["RelatedUrls"] = []
+    monkeypatch.setattr(
+        earthaccess,
+        "search_data",
+        lambda **_kwargs: [_mock_granule("granule1.qi"), granule_without_links],
+    )
+
+    result = _find_iceflow_data(
+        dataset=ILATM1BDataset(version="1"),
+        bounding_box=BoundingBox(
+            lower_left_lon=-180,
+            lower_left_lat=-90,
+            upper_right_lon=180,
+            upper_right_lat=90,
+        ),
+        temporal=(dt.date(2009, 1, 1), dt.date(2009, 12, 31)),
+    )
+
+    assert [granule.data_links() for granule in result.granules] == [
+        ["https://n5eil01u.ecs.nsidc.org/granule1.qi"],
+        [],
+    ]
+
+
+def test_find_iceflow_data(monkeypatch):
+    logins: list[bool] = []
+    monkeypatch.setattr(fetch, "_is_logged_in", lambda: bool(logins))
+    monkeypatch.setattr(earthaccess, "login", lambda: logins.append(True))
+    monkeypatch.setattr(
+        earthaccess,
+        "search_data",
+        lambda short_name, **_kwargs: [_mock_granule(f"{short_name}.granule")],
+    )
+
+    dataset_search_params = DatasetSearchParameters(
+        datasets=[ILVIS2Dataset(version="1"), ILATM1BDataset(version="1")],
+        bounding_box=BoundingBox(
+            lower_left_lon=-180,
+            lower_left_lat=-90,
+            upper_right_lon=180,
+            upper_right_lat=90,
+        ),
+        temporal=(dt.date(2009, 1, 1), dt.date(2009, 12, 31)),
+    )
+    find_iceflow_data(dataset_search_params=dataset_search_params)
+    results = find_iceflow_data(dataset_search_params=dataset_search_params)
+
+    # The datasets are searched concurrently, and the results are in the same
+    # order as the datasets. Once logged in, there is no need to log in again.
+    assert logins == [True]
+    assert [result.dataset.short_name for result in results] == ["ILVIS2", "ILATM1B"]
+    assert [result.granules[0].data_links() for result in results] == [
+        ["https://n5eil01u.ecs.nsidc.org/ILVIS2.granule"],
+        ["https://n5eil01u.ecs.nsidc.org/ILATM1B.granule"],
+    ]
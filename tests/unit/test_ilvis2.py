@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import pytest
+
+from nsidc.iceflow.data.ilvis2 import ilvis2_data
+
+_LONGITUDES = [0.1, 0.3, 179.9, 180.0, 250.5, 359.9, 12.345678, 109.876543]
+
+
+@pytest.fixture()
+def ilvis2_v1_filepath(tmp_path):
+    lines = ["# LFID SHOTNUMBER TIME CLON CLAT ZC GLON GLAT ZG HLON HLAT ZH"]
+    for i, lon in enumerate(_LONGITUDES):
+        lines.append(
+            f"{i} {100 + i} 55812.{i} {lon} -75.0 100.0 {lon} -75.1 99.0"
+            f" {lon} -75.0 101.0"
+        )
+    filepath = tmp_path / "ILVIS2_AQ2009_1025_R1408_055812.TXT"
+    filepath.write_text("\n".join(lines) + "\n")
+
+    return filepath
+
+
+def test_ilvis2_data_longitudes(ilvis2_v1_filepath):
+    result = ilvis2_data(ilvis2_v1_filepath)
+
+    # Longitudes >= 180 are shifted by -360, one row at a time, and all others
+    # are exactly as given in the file.
+    expected = [lon - 360.0 if lon >= 180.0 else lon for lon in _LONGITUDES]
+    assert result.GLON.to_list() == expected
+    assert result.longitude.to_list() == expected
+    # Longitudes other than GLON are scaled to (whole) micro-degrees.
+    expected_micro_degrees = [int(lon * 10**6) for lon in expected]
+    assert result.CLON.to_list() == expected_micro_degrees
+    assert result.HLON.to_list() == expected_micro_degrees
@@ -4,7 +4,12 @@ import pandas as pd
 import pytest
 
 from nsidc.iceflow.data.models import IceflowDataFrame
-from nsidc.iceflow.itrf.converter import _datetime_to_decimal_year, transform_itrf
+from nsidc.iceflow.itrf import converter
+from nsidc.iceflow.itrf.converter import (
+    _datetimes_to_decimal_years,
+    _get_transformer,
+    transform_itrf,
+)
 
 
 def test_transform_itrf():
@@ -38,7 +43,159 @@ def test_transform_itrf():
 
 
 @pytest.mark.parametrize("timezone", ["America/Denver", "UTC"])
-def test__datetime_to_decimal_year(timezone, monkeypatch):
+def test__datetimes_to_decimal_years_timezone(timezone, monkeypatch):
     monkeypatch.setenv("TZ", timezone)
-    result = _datetime_to_decimal_year(pd.to_datetime("1993-07-02 12:00:00"))
-    assert result == 1993.5
+    result = _datetimes_to_decimal_years(pd.DatetimeIndex(["1993-07-02 12:00:00"]))
+    assert result.tolist() == [1993.5]
+
+
+def test__datetimes_to_decimal_years():
+    result = _datetimes_to_decimal_years(
+        pd.DatetimeIndex(
+            [
+                "1993-01-01 00:00:00",
+                "1993-07-02 12:00:00",
+                # 2000 is a leap year.
+                "2000-07-02 00:00:00",
+                "2019-12-31 23:59:59.5",
+                # Repeated timestamps.
+                "1993-07-02 12:00:00",
+                "1993-01-01 00:00:00",
+            ]
+        )
+    )
+
+    assert result.tolist() == pytest.approx(
+        [1993.0, 1993.5, 2000.5, 2020 - 0.5 / (365 * 86400), 1993.5, 1993.0],
+        abs=1e-12,
+    )
+
+
+def test_transform_itrf_multiple_source_itrfs():
+    synth_df = pd.DataFrame(
+        {
+            # Note: each ITRF has at least two points to avoid the pandas
+            # deprecation warning about single-value series (see
+            # `test_transform_itrf`).
+            "latitude": [70, 70, 70, 70, 70, 70],
+            "longitude": [-50, -50, -50, -50, -50, -50],
+            "elevation": [1, 1, 1, 1, 1, 1],
+            "ITRF": [
+                "ITRF93",
+                "ITRF2014",
+                "ITRF93",
+                "ITRF2008",
+                "ITRF2014",
+                "ITRF2008",
+            ],
+        },
+    )
+    constant_datetime = pd.to_datetime("1993-07-02 12:00:00")
+    synth_df.index = pd.Index([constant_datetime] * 6, name="utc_datetime")
+
+    result = transform_itrf(
+        data=IceflowDataFrame(synth_df),
+        target_itrf="ITRF2014",
+    )
+
+    assert len(result) == 6
+    assert result.ITRF.dtype == "category"
+    assert (result.ITRF == "ITRF2014").all()
+    # The ITRF93 points are transformed the same way regardless of the other
+    # source ITRFs present in the data.
+    assert (result.elevation == 1.0052761882543564).sum() == 2
+    # Points already in the target ITRF are unchanged.
+    assert (result.elevation == 1).sum() == 2
+    # The order of the points is preserved.
+    assert result.elevation.to_numpy()[[1, 4]].tolist() == [1, 1]
+    assert result.elevation.to_numpy()[[0, 2]].tolist() == [1.0052761882543564] * 2
+
+
+def test_transform_itrf_plate_per_source_itrf(monkeypatch):
+    plates = []
+
+    def _get_transformer_spy(**kwargs):
+        plates.append(kwargs["plate"])
+        return _get_transformer(**kwargs)
+
+    monkeypatch.setattr(converter, "_get_transformer", _get_transformer_spy)
+
+    synth_df = pd.DataFrame(
+        {
+            # ITRF93 points in Greenland and ITRF2000 points in Antarctica.
+            "latitude": [70, 70, -75, -75],
+            "longitude": [-50, -50, -110, -110],
+            "elevation": [1, 1, 1, 1],
+            "ITRF": ["ITRF93", "ITRF93", "ITRF2000", "ITRF2000"],
+        },
+        index=pd.Index(
+            [pd.to_datetime("1993-07-02 12:00:00")] * 4, name="utc_datetime"
+        ),
+    )
+
+    transform_itrf(
+        data=IceflowDataFrame(synth_df),
+        target_itrf="ITRF2014",
+        target_epoch="2011.0",
+    )
+
+    # The plate is determined separately for each source ITRF.
+    assert plates == ["NOAM", "ANTA"]
+
+
+def test__get_transformer_cached():
+    transformer_kwargs = {
+        "source_itrf": "ITRF93",
+        "target_itrf": "ITRF2014",
+        "target_epoch": None,
+        "plate": None,
+    }
+    transformer = _get_transformer(**transformer_kwargs)
+
+    assert _get_transformer(**transformer_kwargs) is transformer
+    assert (
+        _get_transformer(
+            **{**transformer_kwargs, "target_epoch": "2011.0", "plate": "NOAM"}
+        )
+        is not transformer
+    )
+
+
+def test_transform_itrf_same_itrf():
+    synth_df = pd.DataFrame(
+        {
+            "latitude": [70, 70],
+            "longitude": [-50, -50],
+            "elevation": [1, 1],
+            "ITRF": ["ITRF2014", "ITRF2014"],
+        },
+        index=pd.Index(
+            [pd.to_datetime("1993-07-02 12:00:00")] * 2, name="utc_datetime"
+        ),
+    )
+    synth_iceflow_df = IceflowDataFrame(synth_df)
+
+    result = transform_itrf(data=synth_iceflow_df, target_itrf="ITRF2014")
+
+    # Data already in the target ITRF are returned as-is.
+    assert result is synth_iceflow_df
+
+
+def test_transform_itrf_does_not_modify_input():
+    synth_df = pd.DataFrame(
+        {
+            "latitude": [70, 70],
+            "longitude": [-50, -50],
+            "elevation": [1, 1],
+            "ITRF": ["ITRF93", "ITRF93"],
+        },
+        index=pd.Index(
+            [pd.to_datetime("1993-07-02 12:00:00")] * 2, name="utc_datetime"
+        ),
+    )
+    synth_iceflow_df = IceflowDataFrame(synth_df)
+
+    transform_itrf(data=synth_iceflow_df, target_itrf="ITRF2014")
+
+    assert synth_iceflow_df.elevation.to_list() == [1, 1]
+    assert (synth_iceflow_df.ITRF == "ITRF93").all()
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+import pandera as pa
+import pytest
+
+from nsidc.iceflow import __version__
+from nsidc.iceflow.data import read
+from nsidc.iceflow.data.models import CommonDataColumnsSchema
+from nsidc.iceflow.data.read import (
+    read_iceflow_datafile,
+    read_iceflow_datafiles,
+    read_iceflow_datafiles_lazy,
+)
+
+
+@pytest.mark.parametrize("num_files", [1, 3])
+def test_read_iceflow_datafiles(ilvis2_v1_filepaths, num_files):
+    result = read_iceflow_datafiles(ilvis2_v1_filepaths[:num_files])
+
+    assert len(result) == 2 * num_files
+    assert result.ITRF.dtype == "category"
+    assert (result.ITRF == "ITRF2000").all()
+    assert result.latitude.to_list() == pytest.approx([-75.1, -75.1] * num_files)
+    assert result.longitude.to_list() == pytest.approx([-109.5, -109.4] * num_files)
+    assert result.elevation.to_list() == pytest.approx([99.0, 98.0] * num_files)
+    assert result.index[:2].to_list() == [
+        pd.Timestamp("2009-10-25 15:30:12.5"),
+        pd.Timestamp("2009-10-25 15:30:12.6"),
+    ]
+
+
+def test_read_iceflow_datafiles_executor(ilvis2_v1_filepaths):
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        result = read_iceflow_datafiles(ilvis2_v1_filepaths, executor=executor)
+
+    expected = read_iceflow_datafiles(ilvis2_v1_filepaths)
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_read_iceflow_datafiles_lazy(ilvis2_v1_filepaths):
+    lazy_result = read_iceflow_datafiles_lazy(ilvis2_v1_filepaths)
+
+    assert lazy_result.npartitions == 3
+    assert list(lazy_result.columns) == ["latitude", "longitude", "elevation", "ITRF"]
+
+    result = lazy_result.compute()
+    expected = read_iceflow_datafiles(ilvis2_v1_filepaths)
+    assert result.latitude.to_list() == pytest.approx(expected.latitude.to_list())
+    assert result.elevation.to_list() == pytest.approx(expected.elevation.to_list())
+    assert (result.ITRF == "ITRF2000").all()
+
+
+def test_read_iceflow_datafiles_schema(ilvis2_v1_filepaths):
+    result = read_iceflow_datafiles(ilvis2_v1_filepaths)
+
+    # The result is not validated again after concatenation, but it is marked as
+    # conforming to the common schema so that e.g., `transform_itrf` does not
+    # validate it either.
+    assert result.pandera.schema == CommonDataColumnsSchema.to_schema()
+    CommonDataColumnsSchema.validate(result)
+
+
+def test_read_iceflow_datafile_cached(ilvis2_v1_filepaths, monkeypatch):
+    filepath = ilvis2_v1_filepaths[0]
+    cache_dir = filepath.parent / ".iceflow_cache"
+
+    # The cache is only used if asked for.
+    read_iceflow_datafile(filepath)
+    assert not cache_dir.exists()
+
+    expected = read_iceflow_datafile(filepath, use_cache=True)
+
+    assert (cache_dir / f"{filepath.name}.{__version__}.parquet").is_file()
+
+    # The second read comes from the cache rather than parsing the file again.
+    def _fail(_filepath):
+        raise AssertionError
+
+    monkeypatch.setitem(read._READERS, "ILVIS2", _fail)
+    result = read_iceflow_datafile(filepath, use_cache=True)
+
+    # The reader returns a (pandera) `ILVIS2DataFrame`, while the cached data
+    # are read back as a plain `pd.DataFrame`.
+    pd.testing.assert_frame_equal(result, expected, check_frame_type=False)
+
+    # Data cached by another version of iceflow are not used.
+    monkeypatch.setattr(read, "__version__", "v0.0.0")
+    with pytest.raises(AssertionError):
+        read_iceflow_datafile(filepath, use_cache=True)
+
+
+def test_read_iceflow_datafile_cache_write_failure(ilvis2_v1_filepaths, monkeypatch):
+    filepath = ilvis2_v1_filepaths[0]
+    cache_dir = filepath.parent / ".iceflow_cache"
+
+    def _fail_to_parquet(_self, path, *_args, **_kwargs):
+        Path(path).write_bytes(b"partial")
+        err_msg = "disk full"
+        raise OSError(err_msg)
+
+    monkeypatch.setattr(pd.DataFrame, "to_parquet", _fail_to_parquet)
+
+    # A failure to write the cache is not an error, and leaves no (temporary or
+    # partial) cache files behind.
+    result = read_iceflow_datafile(filepath, use_cache=True)
+    assert len(result) == 2
+    assert list(cache_dir.iterdir()) == []
+
+
+def test_read_iceflow_datafile_cache_concurrent(ilvis2_v1_filepaths):
+    filepath = ilvis2_v1_filepaths[0]
+
+    # Concurrent writers of the same cache file do not corrupt it.
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(
+            executor.map(
+                functools.partial(read_iceflow_datafile, use_cache=True),
+                [filepath] * 16,
+            )
+        )
+
+    cache_dir = filepath.parent / ".iceflow_cache"
+    assert [path.name for path in cache_dir.iterdir()] == [
+        f"{filepath.name}.{__version__}.parquet"
+    ]
+    result = read_iceflow_datafile(filepath, use_cache=True)
+    pd.testing.assert_frame_equal(
+        result, read_iceflow_datafile(filepath), check_frame_type=False
+    )
+
+
+def test_read_iceflow_datafile_cached_validated(ilvis2_v1_filepaths):
+    filepath = ilvis2_v1_filepaths[0]
+    read_iceflow_datafile(filepath, use_cache=True)
+
+    cache_filepath = (
+        filepath.parent / ".iceflow_cache" / f"{filepath.name}.{__version__}.parquet"
+    )
+    cached = pd.read_parquet(cache_filepath)
+    cached["ITRF"] = "not an ITRF"
+    cached.to_parquet(cache_filepath)
+
+    # Data read back from the cache are validated against the dataset's schema.
+    with pytest.raises(pa.errors.SchemaError):
+        read_iceflow_datafile(filepath, use_cache=True)
+
+
+def test_read_iceflow_datafile_columns(ilvis2_v1_filepaths):
+    filepath = ilvis2_v1_filepaths[0]
+    columns = ["latitude", "elevation"]
+
+    # The first read parses the file, the second reads from the cache.
+    parsed = read_iceflow_datafile(filepath, columns=columns, use_cache=True)
+    cached = read_iceflow_datafile(filepath, columns=columns, use_cache=True)
+
+    for result in (parsed, cached):
+        assert list(result.columns) == columns
+        assert result.index.name == "utc_datetime"
+        assert result.latitude.to_list() == pytest.approx([-75.1, -75.1])